@@ -7,7 +7,7 @@ from rateslib import defaults
 from rateslib.calendars import add_tenor, dcf
 from rateslib.curves import index_left
 from rateslib.default import NoInput
-from rateslib.dual import DualTypes
+from rateslib.dual import Dual, Dual2, DualTypes
 
 
 class _AccruedAndYTMMethods:
@@ -47,8 +47,9 @@ class _AccruedAndYTMMethods:
         This is a general method, used by many types of bonds, for example by UK Gilts,
         German Bunds.
         """
-        r = settlement - self.leg1.schedule.uschedule[acc_idx]
-        s = self.leg1.schedule.uschedule[acc_idx + 1] - self.leg1.schedule.uschedule[acc_idx]
+        uschedule = self.leg1.schedule.uschedule
+        r = settlement - uschedule[acc_idx]
+        s = uschedule[acc_idx + 1] - uschedule[acc_idx]
         return r / s
 
     def _acc_linear_proportion_by_days_long_stub_split(
@@ -62,40 +63,44 @@ class _AccruedAndYTMMethods:
         Otherwise, returns the regular linear proportion.
         [Designed primarily for US Treasuries]
         """
-        if self.leg1.periods[acc_idx].stub:
-            fm = defaults.frequency_months[self.leg1.schedule.frequency]
+        period = self.leg1.periods[acc_idx]
+        if period.stub:
+            schedule = self.leg1.schedule
+            fm = defaults.frequency_months[schedule.frequency]
             f = 12 / fm
-            if self.leg1.periods[acc_idx].dcf * f > 1:
+            period_dcf = period.dcf
+            if period_dcf * f > 1:
                 # long stub
+                uschedule = schedule.uschedule
                 quasi_coupon = add_tenor(
-                    self.leg1.schedule.uschedule[acc_idx + 1],
+                    uschedule[acc_idx + 1],
                     f"-{fm}M",
                     "NONE",
                     NoInput(0),
-                    self.leg1.schedule.roll,
+                    schedule.roll,
                 )
                 quasi_start = add_tenor(
                     quasi_coupon,
                     f"-{fm}M",
                     "NONE",
                     NoInput(0),
-                    self.leg1.schedule.roll,
+                    schedule.roll,
                 )
                 if settlement <= quasi_coupon:
                     # then first part of long stub
                     r = quasi_coupon - settlement
                     s = quasi_coupon - quasi_start
-                    r_ = quasi_coupon - self.leg1.schedule.uschedule[acc_idx]
+                    r_ = quasi_coupon - uschedule[acc_idx]
                     _ = (r_ - r) / s
-                    return _ / (self.leg1.periods[acc_idx].dcf * f)
+                    return _ / (period_dcf * f)
                 else:
                     # then second part of long stub
-                    r = self.leg1.schedule.uschedule[acc_idx + 1] - settlement
-                    s = self.leg1.schedule.uschedule[acc_idx + 1] - quasi_coupon
-                    r_ = quasi_coupon - self.leg1.schedule.uschedule[acc_idx]
+                    r = uschedule[acc_idx + 1] - settlement
+                    s = uschedule[acc_idx + 1] - quasi_coupon
+                    r_ = quasi_coupon - uschedule[acc_idx]
                     s_ = quasi_coupon - quasi_start
                     _ = r_ / s_ + (s - r) / s
-                    return _ / (self.leg1.periods[acc_idx].dcf * f)
+                    return _ / (period_dcf * f)
 
         return self._acc_linear_proportion_by_days(settlement, acc_idx, *args)
 
@@ -120,9 +125,11 @@ class _AccruedAndYTMMethods:
         """
         if self.leg1.periods[acc_idx].stub:
             return self._acc_linear_proportion_by_days(settlement, acc_idx)
-        f = 12 / defaults.frequency_months[self.leg1.schedule.frequency]
-        r = settlement - self.leg1.schedule.uschedule[acc_idx]
-        s = self.leg1.schedule.uschedule[acc_idx + 1] - self.leg1.schedule.uschedule[acc_idx]
+        schedule = self.leg1.schedule
+        uschedule = schedule.uschedule
+        f = 12 / defaults.frequency_months[schedule.frequency]
+        r = settlement - uschedule[acc_idx]
+        s = uschedule[acc_idx + 1] - uschedule[acc_idx]
         if r == s:
             _ = 1.0  # then settlement falls on the coupon date
         elif r.days > 365.0 / f:
@@ -149,10 +156,11 @@ class _AccruedAndYTMMethods:
         Method: compounds "v" by the accrual fraction of the period.
         """
         acc_frac = accrual(settlement, acc_idx)
-        if self.leg1.periods[acc_idx].stub:
+        period = self.leg1.periods[acc_idx]
+        if period.stub:
             # If it is a stub then the remaining fraction must be scaled by the relative size of the
             # stub period compared with a regular period.
-            fd0 = self.leg1.periods[acc_idx].dcf * f * (1 - acc_frac)
+            fd0 = period.dcf * f * (1 - acc_frac)
         else:
             # 1 minus acc_fra is the fraction of the period remaining until the next cashflow.
             fd0 = 1 - acc_frac
@@ -228,9 +236,10 @@ class _AccruedAndYTMMethods:
         Use simple rates with a yield which matches the frequency of the coupon.
         """
         acc_frac = accrual(settlement, acc_idx)
-        if self.leg1.periods[acc_idx].stub:
+        period = self.leg1.periods[acc_idx]
+        if period.stub:
             # is a stub so must account for discounting in a different way.
-            fd0 = self.leg1.periods[acc_idx].dcf * f * (1 - acc_frac)
+            fd0 = period.dcf * f * (1 - acc_frac)
         else:
             fd0 = 1 - acc_frac
 
@@ -254,9 +263,10 @@ class _AccruedAndYTMMethods:
         discount param ``v``.
         """
         acc_frac = accrual(settlement, acc_idx)
-        if self.leg1.periods[acc_idx].stub:
+        period = self.leg1.periods[acc_idx]
+        if period.stub:
             # is a stub so must account for discounting in a different way.
-            fd0 = self.leg1.periods[acc_idx].dcf * f * (1 - acc_frac)
+            fd0 = period.dcf * f * (1 - acc_frac)
         else:
             fd0 = 1 - acc_frac
 
@@ -293,10 +303,11 @@ class _AccruedAndYTMMethods:
         Final period uses a compounding approach where the power is determined by the DCF of that
         period under the bond's specified convention.
         """
-        if self.leg1.periods[acc_idx].stub:
+        period = self.leg1.periods[acc_idx]
+        if period.stub:
             # If it is a stub then the remaining fraction must be scaled by the relative size of the
             # stub period compared with a regular period.
-            fd0 = self.leg1.periods[acc_idx].dcf * f
+            fd0 = period.dcf * f
         else:
             fd0 = 1
         return v**fd0
@@ -315,7 +326,8 @@ class _AccruedAndYTMMethods:
 
         The YTM is assumed to have the same frequency as the coupons.
         """
-        d_ = dcf(self.leg1.periods[acc_idx].start, self.leg1.periods[acc_idx].end, "30E360")
+        period = self.leg1.periods[acc_idx]
+        d_ = dcf(period.start, period.end, "30E360")
         return 1 / (1 + d_ * ytm / 100)  # simple interest
 
     def _v3_simple(
@@ -520,3 +532,76 @@ class _BondConventions(_AccruedAndYTMMethods):
     def _uktb(self):
         """deprecated alias"""
         return self._uk_gbb
+
+
+def _ytm_discounted_sum(
+    cashflows: list[DualTypes],
+    redemption: DualTypes,
+    v1: DualTypes,
+    v2: DualTypes,
+    v3: DualTypes,
+    ex_div: bool,
+) -> DualTypes:
+    """
+    Return the sum of the remaining coupon ``cashflows`` and the ``redemption`` discounted by
+    the YTM factors of a bond ``calc_mode``.
+
+    The first coupon is discounted by ``v1`` and each subsequent coupon by a further ``v2``,
+    except the last, which takes ``v3`` in place of ``v2``. The ``redemption`` is discounted
+    as the last coupon. If ``ex_div`` the first coupon is not receivable and is excluded.
+
+    The sum is evaluated as a polynomial in ``v2`` by Horner's method, from the last cashflow
+    backwards, so each coupon costs a single multiplication. If the intermediate coupons are
+    equal, as for a regular bond, their geometric series is summed in closed form instead,
+    unless ``v2`` is so close to 1 that the closed form would lose precision to cancellation.
+    """
+    if len(cashflows) == 1:
+        d = redemption
+    else:
+        d = (cashflows[-1] + redemption) * v3
+        interior = cashflows[1:-1]
+        k = len(interior)
+        if k > 1 and interior.count(interior[0]) == k and abs(1.0 - v2.real) > 1e-3:
+            # c * (v2 + .. + v2^k) with the final cashflows discounted by v2^k
+            v2_k = v2**k
+            d = d * v2_k + interior[0] * v2 * (1.0 - v2_k) / (1.0 - v2)
+        else:
+            d = _horner(d, interior, v2)
+    if not ex_div:
+        d = d + cashflows[0]
+    return d * v1
+
+
+def _horner(d: DualTypes, cashflows: list[DualTypes], v: DualTypes) -> DualTypes:
+    """
+    Return ``d`` after accumulating each of ``cashflows``, from the last, as ``d = (d + c) * v``.
+
+    When ``d`` and ``v`` are dual numbers of the same single variable, as they are for the
+    ``ytm`` of a bond, and the ``cashflows`` are float, the value and its first and second
+    derivative coefficients are carried as floats by the forward rules of multiplication. Only
+    the result is converted back to a dual number, which avoids creating one per cashflow.
+    """
+    if (
+        type(v) not in (Dual, Dual2)
+        or type(d) is not type(v)
+        or len(v.vars) != 1
+        or d.vars != v.vars
+        or not all(type(c) is float for c in cashflows)
+    ):
+        for cashflow in reversed(cashflows):
+            d = (d + cashflow) * v
+        return d
+
+    b, b1 = v.real, v.dual[0]
+    a, a1 = d.real, d.dual[0]
+    if type(v) is Dual:
+        for cashflow in reversed(cashflows):
+            a = a + cashflow
+            a, a1 = a * b, a * b1 + a1 * b
+        return Dual.vars_from(v, a, v.vars, [a1])
+
+    b2, a2 = v.dual2[0][0], d.dual2[0][0]
+    for cashflow in reversed(cashflows):
+        a = a + cashflow
+        a, a1, a2 = a * b, a * b1 + a1 * b, a * b2 + a1 * b1 + a2 * b
+    return Dual2.vars_from(v, a, v.vars, [a1], [a2])
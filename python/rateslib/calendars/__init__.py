@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import calendar as calendar_mod
+import re
 from datetime import datetime
+from functools import lru_cache
 
-from rateslib.calendars.dcfs import _DCF
+import numpy as np
+
+from rateslib import defaults
+from rateslib.calendars.dcfs import _DCF, _DCF_VEC
 from rateslib.calendars.rs import (
     Cal,
     CalInput,
@@ -13,6 +17,7 @@ from rateslib.calendars.rs import (
     RollDay,
     UnionCal,
     _get_modifier,
+    _get_named_cal,
     _get_rollday,
     get_calendar,
 )
@@ -125,6 +130,11 @@ def dcf(
 
     """
     convention = convention.upper()
+    # the most common conventions are calculated inline, avoiding dispatch through `_DCF`.
+    if convention == "ACT360":
+        return (end - start).days / 360.0
+    elif convention == "ACT365F":
+        return (end - start).days / 365.0
     try:
         return _DCF[convention](start, end, termination, frequency_months, stub, roll, calendar)
     except KeyError:
@@ -136,6 +146,56 @@ def dcf(
         )
 
 
+def dcf_vec(
+    start: np.ndarray | list[datetime],
+    end: np.ndarray | list[datetime],
+    convention: str,
+) -> np.ndarray:
+    """
+    Calculate the day count fractions of an array of periods.
+
+    Parameters
+    ----------
+    start : array of datetime or datetime64
+        The adjusted start dates of the calculation periods.
+    end : array of datetime or datetime64
+        The adjusted end dates of the calculation periods.
+    convention : str
+        The day count convention of the calculation periods, in {"Act365F", "Act360",
+        "30360", "360360", "BondBasis", "30E360", "EuroBondBasis", "1", "1+"}.
+
+    Returns
+    --------
+    ndarray of float
+
+    Notes
+    -----
+    This is equivalent to applying :meth:`~rateslib.calendars.dcf` to each period but the
+    calculation is performed with array operations. Only conventions which do not depend upon
+    a ``termination``, ``frequency_months``, ``stub``, ``roll`` or ``calendar`` are available.
+
+    Examples
+    --------
+
+    .. ipython:: python
+
+       from rateslib.calendars import dcf_vec
+       dcf_vec([dt(2000, 1, 1), dt(2000, 4, 3)], [dt(2000, 4, 3), dt(2000, 7, 3)], "30E360")
+
+    """
+    try:
+        func = _DCF_VEC[convention.upper()]
+    except KeyError:
+        raise ValueError(
+            "`convention` must be in {'Act365f', '1', '1+', 'Act360', "
+            "'30360', '360360', 'BondBasis', '30E360', 'EuroBondBasis'} for `dcf_vec`.",
+        )
+    # keep any time component so that whole days are counted as by ``dcf``
+    start_ = np.asarray(start, dtype="datetime64[us]")
+    end_ = np.asarray(end, dtype="datetime64[us]")
+    return func(start_, end_)
+
+
 # TODO (deprecate): this function on 2.0.0
 def create_calendar(rules: list, week_mask: list[int] = []) -> Cal:
     """
@@ -259,38 +319,85 @@ def add_tenor(
        add_tenor(dt(2022, 12, 28), "4b", "F", get_calendar("ldn"))
        add_tenor(dt(2022, 12, 28), "4d", "F", get_calendar("ldn"))
     """  # noqa: E501
-    tenor = tenor.upper()
-    cal_ = get_calendar(calendar)
-    if "D" in tenor:
-        return cal_.add_days(start, int(tenor[:-1]), _get_modifier(modifier, mod_days), settlement)
-    elif "B" in tenor:
-        return cal_.add_bus_days(start, int(tenor[:-1]), settlement)
-    elif "Y" in tenor:
-        months = int(float(tenor[:-1]) * 12)
+    # named calendars are immutable so the result can be cached by its hashable inputs
+    if calendar is NoInput.blank:
+        return _add_tenor_cached(start, tenor, modifier, "all", roll, settlement, mod_days)
+    elif isinstance(calendar, str) and _is_named_calendar(calendar):
+        return _add_tenor_cached(start, tenor, modifier, calendar, roll, settlement, mod_days)
+    return _add_tenor(start, tenor, modifier, get_calendar(calendar), roll, settlement, mod_days)
+
+
+# the pre-existing named calendars, listed before any user calendars can be added to defaults
+_NAMED_CALENDARS = frozenset(defaults.calendars)
+
+
+def _is_named_calendar(calendar: str) -> bool:
+    """Test if a calendar string combines only pre-existing named calendars, e.g. 'tgt,nyc|fed'."""
+    vectors = calendar.lower().split("|")
+    return len(vectors) <= 2 and all(
+        _ in _NAMED_CALENDARS for vector in vectors for _ in vector.split(",")
+    )
+
+
+@lru_cache(maxsize=8192)
+def _add_tenor_cached(
+    start: datetime,
+    tenor: str,
+    modifier: str,
+    calendar: str,
+    roll: str | int | NoInput,
+    settlement: bool,
+    mod_days: bool,
+) -> datetime:
+    """Memoized :meth:`add_tenor` for named calendars. Errors are raised and not cached."""
+    cal_ = _get_named_cal(calendar)
+    return _add_tenor(start, tenor, modifier, cal_, roll, settlement, mod_days)
+
+
+# a signed count, fractional only for years, followed by a single frequency unit
+_TENOR_RE = re.compile(r"^([+-]?\d*\.?\d+)([BDWMY])$")
+
+
+def _add_tenor(
+    start: datetime,
+    tenor: str,
+    modifier: str,
+    cal_: CalTypes,
+    roll: str | int | NoInput,
+    settlement: bool,
+    mod_days: bool,
+) -> datetime:
+    match = _TENOR_RE.match(tenor.strip().upper())
+    if match is None:
+        raise ValueError("`tenor` must identify frequency in {'B', 'D', 'W', 'M', 'Y'} e.g. '1Y'")
+    n, unit = match.groups()
+    if unit == "D":
+        return cal_.add_days(start, int(n), _get_modifier(modifier, mod_days), settlement)
+    elif unit == "B":
+        return cal_.add_bus_days(start, int(n), settlement)
+    elif unit == "Y":
         return cal_.add_months(
             start,
-            months,
+            int(float(n) * 12),
             _get_modifier(modifier, True),
             _get_rollday(roll),
             settlement,
         )
-    elif "M" in tenor:
+    elif unit == "M":
         return cal_.add_months(
             start,
-            int(tenor[:-1]),
+            int(n),
             _get_modifier(modifier, True),
             _get_rollday(roll),
             settlement,
         )
-    elif "W" in tenor:
+    else:  # unit == "W"
         return cal_.add_days(
             start,
-            int(tenor[:-1]) * 7,
+            int(n) * 7,
             _get_modifier(modifier, mod_days),
             settlement,
         )
-    else:
-        raise ValueError("`tenor` must identify frequency in {'B', 'D', 'W', 'M', 'Y'} e.g. '1Y'")
 
 
 MONTHS = {
@@ -363,7 +470,6 @@ def _adjust_date(
     datetime
     """
     cal_ = get_calendar(calendar)
-    modifier = modifier.upper()
     return cal_.roll(date, _get_modifier(modifier, True), settlement)
 
 
@@ -445,8 +551,8 @@ def _get_imm(month: int, year: int) -> datetime:
     -------
     int : Day
     """
-    imm_map = {0: 17, 1: 16, 2: 15, 3: 21, 4: 20, 5: 19, 6: 18}
-    return datetime(year, month, imm_map[datetime(year, month, 1).weekday()])
+    # the first Wednesday is (2 - weekday) % 7 days after the 1st, and the third 14 days later.
+    return datetime(year, month, 15 + (2 - datetime(year, month, 1).weekday()) % 7)
 
 
 def _is_eom(date: datetime) -> bool:
@@ -462,13 +568,12 @@ def _is_eom(date: datetime) -> bool:
     -------
     bool
     """
-    return date.day == calendar_mod.monthrange(date.year, date.month)[1]
+    return date.day == _eom_day(date.year, date.month)
 
 
 def _is_eom_cal(date: datetime, cal: CalInput):
     """Test whether a given date is end of month under a specific calendar"""
-    udate = calendar_mod.monthrange(date.year, date.month)[1]
-    udate = datetime(date.year, date.month, udate)
+    udate = datetime(date.year, date.month, _eom_day(date.year, date.month))
     aeom = _adjust_date(udate, "P", cal)
     return date == aeom
 
@@ -488,7 +593,17 @@ def _get_eom(month: int, year: int) -> datetime:
     -------
     int : Day
     """
-    return datetime(year, month, calendar_mod.monthrange(year, month)[1])
+    return datetime(year, month, _eom_day(year, month))
+
+
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _eom_day(year: int, month: int) -> int:
+    """Return the last day of the month, avoiding the tuple constructed by `monthrange`."""
+    if month == 2 and ((year % 4 == 0 and year % 100 != 0) or year % 400 == 0):
+        return 29
+    return _MDAYS[month - 1]
 
 
 # Licence: Creative Commons - Attribution-NonCommercial-NoDerivatives 4.0 International
@@ -580,6 +695,7 @@ __all__ = (
     "CalTypes",
     "create_calendar",
     "dcf",
+    "dcf_vec",
     "Modifier",
     "NamedCal",
     "RollDay",
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import calendar as calendar_mod
 import warnings
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
 
 from rateslib.calendars.rs import CalInput, _get_modifier, _get_rollday, get_calendar
 from rateslib.default import NoInput
@@ -89,15 +92,15 @@ def _dcf_actactisda(start: datetime, end: datetime, *args):
     if start == end:
         return 0.0
 
-    start_date = datetime.combine(start, datetime.min.time())
-    end_date = datetime.combine(end, datetime.min.time())
+    # day counts use ordinals, which disregard any time component, instead of creating datetimes
+    start_ord, end_ord = start.toordinal(), end.toordinal()
 
-    year_1_diff = 366.0 if calendar_mod.isleap(start_date.year) else 365.0
-    year_2_diff = 366.0 if calendar_mod.isleap(end_date.year) else 365.0
+    year_1_diff = 366.0 if calendar_mod.isleap(start.year) else 365.0
+    year_2_diff = 366.0 if calendar_mod.isleap(end.year) else 365.0
 
     total_sum: float = end.year - start.year - 1
-    total_sum += (datetime(start.year + 1, 1, 1) - start_date).days / year_1_diff
-    total_sum += (end_date - datetime(end.year, 1, 1)).days / year_2_diff
+    total_sum += (date(start.year + 1, 1, 1).toordinal() - start_ord) / year_1_diff
+    total_sum += (end_ord - date(end.year, 1, 1).toordinal()) / year_2_diff
     return total_sum
 
 
@@ -129,42 +132,60 @@ def _dcf_actacticma(
             )
             frequency_months = 12  # Will handle Z frequency as a stub period see GH:144
 
-        # roll is used here to roll a negative months forward eg, 30 sep minus 6M = 30/31 March.
-        cal_ = get_calendar(calendar)
-        if end == termination:  # stub is a BACK stub:
-            fwd_end_0, fwd_end_1, fraction = start, start, -1.0
-            while (
-                end > fwd_end_1
-            ):  # Handle Long Stubs which require repeated periods, and Zero frequencies.
-                fwd_end_0 = fwd_end_1
-                fraction += 1.0
-                fwd_end_1 = cal_.add_months(
-                    start,
-                    (int(fraction) + 1) * frequency_months,
-                    _get_modifier("NONE", True),
-                    _get_rollday(roll),
-                    False,
-                )
-
-            fraction += (end - fwd_end_0) / (fwd_end_1 - fwd_end_0)
-            return fraction * frequency_months / 12.0
-        else:  # stub is a FRONT stub
-            prev_start_0, prev_start_1, fraction = end, end, -1.0
-            while (
-                start < prev_start_1
-            ):  # Handle Long Stubs which require repeated periods, and Zero frequencies.
-                prev_start_0 = prev_start_1
-                fraction += 1.0
-                prev_start_1 = cal_.add_months(
-                    end,
-                    -(int(fraction) + 1) * frequency_months,
-                    _get_modifier("NONE", True),
-                    _get_rollday(roll),
-                    False,
-                )
-
-            fraction += (prev_start_0 - start) / (prev_start_0 - prev_start_1)
-            return fraction * frequency_months / 12.0
+        return _dcf_actacticma_stub(start, end, termination, frequency_months, roll)
+
+
+@lru_cache(maxsize=16384)
+def _dcf_actacticma_stub(
+    start: datetime,
+    end: datetime,
+    termination: datetime,
+    frequency_months: int,
+    roll: str | int | NoInput,
+) -> float:
+    """
+    Memoized stub and zero coupon fraction of :meth:`_dcf_actacticma`.
+
+    The dates are generated with no modifier, so are never adjusted by a calendar, and the
+    result depends only on these hashable arguments.
+    """
+    # roll is used here to roll a negative months forward eg, 30 sep minus 6M = 30/31 March.
+    cal_ = get_calendar(NoInput(0))
+    modifier, rollday = _get_modifier("NONE", True), _get_rollday(roll)
+    if end == termination:  # stub is a BACK stub:
+        fwd_end_0, fwd_end_1, fraction = start, start, -1.0
+        while (
+            end > fwd_end_1
+        ):  # Handle Long Stubs which require repeated periods, and Zero frequencies.
+            fwd_end_0 = fwd_end_1
+            fraction += 1.0
+            fwd_end_1 = cal_.add_months(
+                start,
+                (int(fraction) + 1) * frequency_months,
+                modifier,
+                rollday,
+                False,
+            )
+
+        fraction += (end - fwd_end_0) / (fwd_end_1 - fwd_end_0)
+        return fraction * frequency_months / 12.0
+    else:  # stub is a FRONT stub
+        prev_start_0, prev_start_1, fraction = end, end, -1.0
+        while (
+            start < prev_start_1
+        ):  # Handle Long Stubs which require repeated periods, and Zero frequencies.
+            prev_start_0 = prev_start_1
+            fraction += 1.0
+            prev_start_1 = cal_.add_months(
+                end,
+                -(int(fraction) + 1) * frequency_months,
+                modifier,
+                rollday,
+                False,
+            )
+
+        fraction += (prev_start_0 - start) / (prev_start_0 - prev_start_1)
+        return fraction * frequency_months / 12.0
 
 
 def _dcf_actacticma_stub365f(
@@ -307,6 +328,64 @@ _DCF = {
     "BUS252": _dcf_bus252,
 }
 
+
+def _ymd(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the year, month and day components of an array of *datetime64*."""
+    days = dates.astype("datetime64[D]")
+    months = days.astype("datetime64[M]")
+    y = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    m = months.astype(np.int64) % 12 + 1
+    d = (days - months).astype(np.int64) + 1
+    return y, m, d
+
+
+def _days_vec(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Return whole days between arrays of *datetime64*, floored as ``timedelta.days``."""
+    return (end - start) // np.timedelta64(1, "D")
+
+
+def _dcf_vec_act365f(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return _days_vec(start, end) / 365.0
+
+
+def _dcf_vec_act360(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return _days_vec(start, end) / 360.0
+
+
+def _dcf_vec_30360(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    (ys, ms, ds), (ye, me, de) = _ymd(start), _ymd(end)
+    ds = np.minimum(30, ds)
+    de = np.where(ds == 30, np.minimum(30, de), de)
+    return ye - ys + (me - ms) / 12.0 + (de - ds) / 360.0
+
+
+def _dcf_vec_30e360(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    (ys, ms, ds), (ye, me, de) = _ymd(start), _ymd(end)
+    ds, de = np.minimum(30, ds), np.minimum(30, de)
+    return ye - ys + (me - ms) / 12.0 + (de - ds) / 360.0
+
+
+def _dcf_vec_1(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return np.ones(np.broadcast(start, end).shape)
+
+
+def _dcf_vec_1plus(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    (ys, ms, _), (ye, me, _) = _ymd(start), _ymd(end)
+    return ye - ys + (me - ms) / 12.0
+
+
+_DCF_VEC = {
+    "ACT365F": _dcf_vec_act365f,
+    "ACT360": _dcf_vec_act360,
+    "30360": _dcf_vec_30360,
+    "360360": _dcf_vec_30360,
+    "BONDBASIS": _dcf_vec_30360,
+    "30E360": _dcf_vec_30e360,
+    "EUROBONDBASIS": _dcf_vec_30e360,
+    "1": _dcf_vec_1,
+    "1+": _dcf_vec_1plus,
+}
+
 _DCF1d = {
     "ACT365F": 1.0 / 365,
     "ACT365F+": 1.0 / 365,
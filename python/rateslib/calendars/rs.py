@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 from rateslib import defaults
@@ -11,13 +12,16 @@ Modifier.__doc__ = "Enumerable type for modification rules."
 RollDay.__doc__ = "Enumerable type for roll day types."
 
 
+_ROLLDAYS = {
+    "EOM": RollDay.EoM(),
+    "SOM": RollDay.SoM(),
+    "IMM": RollDay.IMM(),
+}
+
+
 def _get_rollday(roll: Union[str, int, NoInput]) -> RollDay:
     if isinstance(roll, str):
-        return {
-            "EOM": RollDay.EoM(),
-            "SOM": RollDay.SoM(),
-            "IMM": RollDay.IMM(),
-        }[roll.upper()]
+        return _ROLLDAYS[roll.upper()]
     elif isinstance(roll, int):
         return RollDay.Int(roll)
     return RollDay.Unspecified()
@@ -132,7 +136,7 @@ def get_calendar(
     # TODO: rename calendars or make a more generalist statement about their names.
     if isinstance(calendar, str) and named:
         try:
-            return _get_calendar_labelled(NamedCal(calendar), "object", kind)
+            return _get_calendar_labelled(_get_named_cal(calendar), "object", kind)
         except ValueError:
             named = False  # try parsing with Python only
 
@@ -160,6 +164,17 @@ def get_calendar(
         return _get_calendar_labelled(calendar, "custom", kind)
 
 
+@lru_cache(maxsize=128)
+def _get_named_cal(calendar: str) -> NamedCal:
+    """
+    Return a *NamedCal* from a string, constructing each distinct string only once.
+
+    *NamedCal* objects are immutable so a single instance is shared by all callers.
+    Invalid names raise and are not cached.
+    """
+    return NamedCal(calendar)
+
+
 def _get_calendar_labelled(output, label, kind):
     """Package the return for the get_calendar function"""
     if kind:
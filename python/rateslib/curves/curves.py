@@ -10,8 +10,9 @@ from __future__ import annotations
 
 import json
 import warnings
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from math import comb, floor
+from math import comb
 from typing import TYPE_CHECKING, Any, Callable
 from uuid import uuid4
 
@@ -2854,8 +2855,8 @@ def index_left(
     value : Any
         The value for which to determine the list index of.
     left_count : int
-        The counter to pass recursively to determine the output. Users should not
-        directly specify, it is used in internal calculation only.
+        An offset added to the output. Users should not directly specify, it is retained
+        for compatibility only.
 
     Returns
     -------
@@ -2903,17 +2904,10 @@ def index_left(
     if list_length == 1:
         raise ValueError("`index_left` designed for intervals. Cannot index list of length 1.")
 
-    if list_length == 2:
-        return left_count
-
-    split = floor((list_length - 1) / 2)
-    if list_length == 3 and value == list_input[split]:
-        return left_count
-
-    if value <= list_input[split]:
-        return index_left(list_input[: split + 1], split + 1, value, left_count)
-    else:
-        return index_left(list_input[split:], list_length - split, value, left_count + split)
+    # the first index whose element is not less than value is the right end of the interval.
+    # bisect searches in place, where a recursive search on slices would copy the list.
+    idx = bisect_left(list_input, value, 0, list_length) - 1
+    return left_count + min(max(idx, 0), list_length - 2)
 
 
 # # ALTERNATIVE index_left: exhaustive search which is inferior to binary search
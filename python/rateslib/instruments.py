@@ -16,7 +16,7 @@ from pandas import DataFrame, MultiIndex, Series, concat, isna
 from pandas.tseries.offsets import CustomBusinessDay
 
 from rateslib import defaults
-from rateslib.bonds import _BondConventions
+from rateslib.bonds import _BondConventions, _ytm_discounted_sum
 from rateslib.calendars import (
     _get_fx_expiry_and_delivery,
     _get_years_and_months,
@@ -62,7 +62,10 @@ from rateslib.splines import evaluate
 
 
 def _get_curve_from_solver(curve, solver):
-    if isinstance(curve, dict):
+    if isinstance(curve, str):
+        # str ids are the most common input for solver based pricing so are tested first
+        return solver.pre_curves[curve]
+    elif isinstance(curve, dict):
         # When supplying a curve as a dictionary of curves (for IBOR stubs) use recursion
         return {k: _get_curve_from_solver(v, solver) for k, v in curve.items()}
     elif getattr(curve, "_is_proxy", False):
@@ -71,8 +74,6 @@ def _get_curve_from_solver(curve, solver):
         # with curves inside the solver, so can still generate risks to calibrating
         # instruments
         return curve
-    elif isinstance(curve, str):
-        return solver.pre_curves[curve]
     elif curve is NoInput.blank or curve is None:
         # pass through a None curve. This will either raise errors later or not be needed
         return NoInput(0)
@@ -81,7 +82,7 @@ def _get_curve_from_solver(curve, solver):
             # it is a safeguard to load curves from solvers when a solver is
             # provided and multiple curves might have the same id
             _ = solver.pre_curves[curve.id]
-            if id(_) != id(curve):  # Python id() is a memory id, not a string label id.
+            if _ is not curve:  # the same string label id but a different object
                 raise ValueError(
                     "A curve has been supplied, as part of ``curves``, which has the same "
                     f"`id` ('{curve.id}'),\nas one of the curves available as part of the "
@@ -187,7 +188,13 @@ def _get_curves_maybe_from_solver(
         curves_ = tuple(check_curve(curve) for curve in curves)
     else:
         try:
-            curves_ = tuple(_get_curve_from_solver(curve, solver) for curve in curves)
+            if hasattr(solver, "_resolve_str_curves") and all(
+                isinstance(curve, str) for curve in curves
+            ):
+                # str ids always resolve to the same objects, so the solver caches the lookup
+                curves_ = solver._resolve_str_curves(tuple(curves))
+            else:
+                curves_ = tuple(_get_curve_from_solver(curve, solver) for curve in curves)
         except KeyError:
             raise ValueError(
                 "`curves` must contain str curve `id` s existing in `solver` "
@@ -441,21 +448,25 @@ class Sensitivities:
         if local:
             base_ = NoInput(0)
 
-        # store original order
+        # store original order. Setting an order resets the solver's calculated properties
+        # and rebuilds FX objects, so only do so if not already in second order mode.
         if fx_ is not NoInput.blank:
             _ad2 = fx_._ad
-            fx_._set_ad_order(2)
+            if _ad2 != 2:
+                fx_._set_ad_order(2)
 
         _ad1 = solver._ad
-        solver._set_ad_order(2)
+        if _ad1 != 2:
+            solver._set_ad_order(2)
 
         npv = self.npv(curves, solver, fx_, base_, local=True, **kwargs)
         grad_s_sT_P = solver.gamma(npv, base_, fx_)
 
         # reset original order
-        if fx_ is not NoInput.blank:
+        if fx_ is not NoInput.blank and _ad2 != 2:
             fx_._set_ad_order(_ad2)
-        solver._set_ad_order(_ad1)
+        if _ad1 != 2:
+            solver._set_ad_order(_ad1)
 
         return grad_s_sT_P
 
@@ -1334,28 +1345,76 @@ class BondMixin(_BondConventions):
         **not** be classified as ex-dividend and will receive that coupon (in the default
         calculation mode).
         """
-        prev_a_idx = index_left(
-            self.leg1.schedule.uschedule,
-            len(self.leg1.schedule.uschedule),
-            settlement,
-        )
-        ex_div_date = self.leg1.schedule.calendar.lag(
-            self.leg1.schedule.uschedule[prev_a_idx + 1],
-            -self.kwargs["ex_div"],
-            True,
-        )
+        return self._ex_div_in_period(settlement, self._period_index(settlement))
+
+    def _ex_div_in_period(self, settlement: datetime, acc_idx: int):
+        # ex_div with a pre-determined unadjusted schedule period index
+        ex_div_date = self._ex_div_dates()[acc_idx]
         if self.calc_mode in []:  # currently no identified calc_modes
             return settlement >= ex_div_date  # pragma: no cover
         else:
             return settlement > ex_div_date
 
+    def _ex_div_dates(self):
+        """
+        Return the ex-div date of every period of ``leg1`` as a list.
+
+        These depend only on the schedule and the ``ex_div`` business days so are determined
+        once, and again only if ``ex_div`` is changed.
+        """
+        ex_div = self.kwargs["ex_div"]
+        cache = getattr(self, "_ex_div_dates_cache", None)
+        if cache is None or cache[0] != ex_div:
+            calendar = self.leg1.schedule.calendar
+            cache = (
+                ex_div,
+                [calendar.lag(d, -ex_div, True) for d in self.leg1.schedule.uschedule[1:]],
+            )
+            self._ex_div_dates_cache = cache
+        return cache[1]
+
+    def _settlement_from_curve(self, curve: Curve):
+        """
+        Return the regular settlement date of the bond measured from the initial node date
+        of ``curve``.
+
+        The most recent result is retained since the same curve is typically used to price
+        repeatedly, e.g. within a *Solver* or across ``npv``, ``rate`` and ``cashflows``.
+        """
+        key = (curve.node_dates[0], self.kwargs["settle"])
+        cache = getattr(self, "_settlement_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (key, self.leg1.schedule.calendar.lag(key[0], key[1], True))
+            self._settlement_cache = cache
+        return cache[1]
+
+    def _period_cashflows(self):
+        """
+        Return the ``_ytm_attribute`` of every period of ``leg1`` as a list.
+
+        The list is cached against the ``fixed_rate`` object and ``notional`` of the leg, which
+        are the only mutable inputs to a bond coupon, so that repeated pricing (e.g. iterating
+        a yield) does not recompute every period day count fraction.
+        """
+        key = (self.leg1.fixed_rate, self.leg1.notional)
+        cache = getattr(self, "_period_cashflows_cache", None)
+        if cache is None or cache[0][0] is not key[0] or cache[0][1] != key[1]:
+            cache = (key, [getattr(p, self._ytm_attribute) for p in self.leg1.periods])
+            self._period_cashflows_cache = cache
+        return cache[1]
+
     def _accrued(self, settlement: datetime, func: callable):
         """func is the specific accrued function associated with the bond ``calc_mode``"""
         acc_idx = self._period_index(settlement)
+        ex_div = self._ex_div_in_period(settlement, acc_idx)
+        return self._accrued_in_period(settlement, func, acc_idx, ex_div)
+
+    def _accrued_in_period(self, settlement: datetime, func: callable, acc_idx: int, ex_div: bool):
+        """As ``_accrued`` with the coupon period index and ex-div status already determined."""
         frac = func(settlement, acc_idx)
-        if self.ex_div(settlement):
+        if ex_div:
             frac = frac - 1  # accrued is negative in ex-div period
-        _ = getattr(self.leg1.periods[acc_idx], self._ytm_attribute)
+        _ = self._period_cashflows()[acc_idx]
         return frac * _ / -self.leg1.notional * 100
 
     def _generic_ytm(
@@ -1371,43 +1430,28 @@ class BondMixin(_BondConventions):
         """
         Refer to supplementary material.
         """
-        f = 12 / defaults.frequency_months[self.leg1.schedule.frequency]
+        f = self._periods_per_year
         acc_idx = self._period_index(settlement)
 
         v2 = f2(ytm, f, settlement, acc_idx)
         v1 = f1(ytm, f, settlement, acc_idx, v2, accrual)
-        v3 = f3(ytm, f, settlement, self.leg1.schedule.n_periods - 1, v2, accrual)
-
-        # Sum up the coupon cashflows discounted by the calculated factors
-        d = 0
-        for i, p_idx in enumerate(range(acc_idx, self.leg1.schedule.n_periods)):
-            if i == 0 and self.ex_div(settlement):
-                # no coupon cashflow is receiveable so no addition to the sum
-                continue
-            elif i == 0 and p_idx == (self.leg1.schedule.n_periods - 1):
-                # the last period is the first period so discounting handled only by v1
-                d += getattr(self.leg1.periods[p_idx], self._ytm_attribute) * v1
-            elif p_idx == (self.leg1.schedule.n_periods - 1):
-                # this is last period, but it is not the first (i>0). Tag on v3 at end.
-                d += (
-                    getattr(self.leg1.periods[p_idx], self._ytm_attribute) * v2 ** (i - 1) * v3 * v1
-                )
-            else:
-                # this is not the first and not the last period. Discount only with v1 and v2.
-                d += getattr(self.leg1.periods[p_idx], self._ytm_attribute) * v2**i * v1
+        n = self.leg1.schedule.n_periods
+        v3 = f3(ytm, f, settlement, n - 1, v2, accrual)
 
-        # Add the redemption payment discounted by relevant factors
-        if i == 0:  # only looped 1 period, only use the last discount
-            d += getattr(self.leg1.periods[-1], self._ytm_attribute) * v1
-        elif i == 1:  # only looped 2 periods, no need for v2
-            d += getattr(self.leg1.periods[-1], self._ytm_attribute) * v3 * v1
-        else:  # looped more than 2 periods, regular formula applied
-            d += getattr(self.leg1.periods[-1], self._ytm_attribute) * v2 ** (i - 1) * v3 * v1
+        # Sum up the coupon cashflows and the redemption discounted by the calculated factors
+        period_cashflows = self._period_cashflows()
+        cashflows = period_cashflows[acc_idx:n]
+        redemption = period_cashflows[-1]
+        ex_div = self._ex_div_in_period(settlement, acc_idx)
+        d = _ytm_discounted_sum(cashflows, redemption, v1, v2, v3, ex_div)
 
         # discount all by the first period factor and scaled to price
         p = d / -self.leg1.notional * 100
 
-        return p if dirty else p - self._accrued(settlement, accrual)
+        if dirty:
+            return p
+        # the accrued is in the same period so the index and ex-div status are reused
+        return p - self._accrued_in_period(settlement, accrual, acc_idx, ex_div)
 
     def _price_from_ytm(
         self,
@@ -1475,16 +1519,20 @@ class BondMixin(_BondConventions):
         Any intermediate (non ex-dividend) cashflows between ``settlement`` and
         ``forward_settlement`` will also be assumed to accrue at ``repo_rate``.
         """
+        if self.leg1.amortization != 0:
+            raise NotImplementedError(
+                "method for forward price not available with amortization",
+            )  # pragma: no cover
+        if forward_settlement == settlement:
+            # no repo accrues and no coupons are received over zero time
+            return price
+
         convention = defaults.convention if convention is NoInput.blank else convention
         dcf_ = dcf(settlement, forward_settlement, convention)
         if not dirty:
             d_price = price + self.accrued(settlement)
         else:
             d_price = price
-        if self.leg1.amortization != 0:
-            raise NotImplementedError(
-                "method for forward price not available with amortization",
-            )  # pragma: no cover
         total_rtn = d_price * (1 + repo_rate * dcf_ / 100) * -self.leg1.notional / 100
 
         # now systematically deduct coupons paid between settle and forward settle
@@ -1643,29 +1691,22 @@ class BondMixin(_BondConventions):
         initial node date of the ``disc_curve``.
         """
         self._set_base_index_if_none(curve)
-        npv = self.leg1.npv(curve, disc_curve, NoInput(0), NoInput(0))
 
-        # now must systematically deduct any cashflow between the initial node date
+        # must systematically exclude any cashflow between the initial node date
         # and the settlement date, including the cashflow after settlement if ex_div.
-        initial_idx = index_left(
-            self.leg1.schedule.aschedule,
-            self.leg1.schedule.n_periods + 1,
-            disc_curve.node_dates[0],
-        )
-        settle_idx = index_left(
-            self.leg1.schedule.aschedule,
-            self.leg1.schedule.n_periods + 1,
-            settlement,
+        # These are omitted from the sum rather than valued and then deducted.
+        aschedule = self.leg1.schedule.aschedule
+        n = self.leg1.schedule.n_periods + 1
+        initial_idx = index_left(aschedule, n, disc_curve.node_dates[0])
+        settle_idx = index_left(aschedule, n, settlement)
+        ex_div_idx = settle_idx if self.ex_div(settlement) else None
+
+        npv = sum(
+            period.npv(curve, disc_curve, NoInput(0), NoInput(0))
+            for i, period in enumerate(self.leg1.periods)
+            if not (initial_idx <= i < settle_idx or i == ex_div_idx)
         )
 
-        for period_idx in range(initial_idx, settle_idx):
-            # deduct coupon period
-            npv -= self.leg1.periods[period_idx].npv(curve, disc_curve, NoInput(0), NoInput(0))
-
-        if self.ex_div(settlement):
-            # deduct coupon after settlement which is also unpaid
-            npv -= self.leg1.periods[settle_idx].npv(curve, disc_curve, NoInput(0), NoInput(0))
-
         if projection is NoInput.blank:
             return npv
         else:
@@ -1729,11 +1770,7 @@ class BondMixin(_BondConventions):
             base,
             self.leg1.currency,
         )
-        settlement = self.leg1.schedule.calendar.lag(
-            curves[1].node_dates[0],
-            self.kwargs["settle"],
-            True,
-        )
+        settlement = self._settlement_from_curve(curves[1])
         npv = self._npv_local(curves[0], curves[1], settlement, NoInput(0))
         return _maybe_local(npv, local, self.leg1.currency, fx_, base_)
 
@@ -1750,11 +1787,7 @@ class BondMixin(_BondConventions):
         For arguments see :meth:`~rateslib.periods.BasePeriod.analytic_delta`.
         """
         disc_curve_: Curve | NoInput = _disc_maybe_from_curve(curve, disc_curve)
-        settlement = self.leg1.schedule.calendar.lag(
-            disc_curve_.node_dates[0],
-            self.kwargs["settle"],
-            True,
-        )
+        settlement = self._settlement_from_curve(disc_curve_)
         a_delta = self.leg1.analytic_delta(curve, disc_curve_, fx, base)
         if self.ex_div(settlement):
             # deduct the next coupon which has otherwise been included in valuation
@@ -1822,11 +1855,7 @@ class BondMixin(_BondConventions):
         if settlement is NoInput.blank and curves[1] is NoInput.blank:
             settlement = self.leg1.schedule.effective
         elif settlement is NoInput.blank:
-            settlement = self.leg1.schedule.calendar.lag(
-                curves[1].node_dates[0],
-                self.kwargs["settle"],
-                True,
-            )
+            settlement = self._settlement_from_curve(curves[1])
         cashflows = self.leg1.cashflows(curves[0], curves[1], fx_, base_)
         if self.ex_div(settlement):
             # deduct the next coupon which has otherwise been included in valuation
@@ -2331,6 +2360,7 @@ class FixedRateBond(Sensitivities, BondMixin, BaseMixin):
 
         self._fixed_rate = fixed_rate
         self.leg1 = FixedLeg(**_get(self.kwargs, leg=1, filter=["ex_div", "settle", "calc_mode"]))
+        self._periods_per_year = 12 / defaults.frequency_months[self.kwargs["frequency"].upper()]
 
         if self.leg1.amortization != 0:
             # Note if amortization is added to FixedRateBonds must systematically
@@ -2413,11 +2443,7 @@ class FixedRateBond(Sensitivities, BondMixin, BaseMixin):
         metric = metric.lower()
         if metric in ["clean_price", "dirty_price", "ytm"]:
             if forward_settlement is NoInput.blank:
-                settlement = self.leg1.schedule.calendar.lag(
-                    curves[1].node_dates[0],
-                    self.kwargs["settle"],
-                    True,
-                )
+                settlement = self._settlement_from_curve(curves[1])
             else:
                 settlement = forward_settlement
             npv = self._npv_local(curves[0], curves[1], settlement, settlement)
@@ -2511,23 +2537,49 @@ class FixedRateBond(Sensitivities, BondMixin, BaseMixin):
             # back below, see PR GH3
             return self._price_from_ytm(y, settlement, self.calc_mode, dirty) - float(price)
 
+        last = {}  # the yield and price gradient of the latest newton step
+
+        if isinstance(self.fixed_rate, (Dual, Dual2)):
+
+            def root_and_gradient(y):
+                p = self._price_from_ytm(Dual(y, ["y"], []), settlement, self.calc_mode, dirty)
+                last["y"], last["grad"] = y, gradient(p, ["y"])[0]
+                return float(p) - float(price), last["grad"]
+
+        else:
+
+            def root_and_gradient(y):
+                # complex step gives the price and its exact derivative in native arithmetic
+                p = self._price_from_ytm(complex(y, 1e-100), settlement, self.calc_mode, dirty)
+                last["y"], last["grad"] = y, p.imag * 1e100
+                return p.real - float(price), last["grad"]
+
         # x = brentq(root, -99, 10000)  # remove dependence to scipy.optimize.brentq
         # x, iters = _brents(root, -99, 10000)  # use own local brents code
-        x = _ytm_quadratic_converger2(root, -3.0, 2.0, 12.0)  # use special quad interp
+        # newton iterations from the coupon rate use the exact AD derivative of price
+        x = _ytm_newton(root_and_gradient, float(_drb(2.0, self.fixed_rate)))
+        if x is None:
+            x = _ytm_quadratic_converger2(root, -3.0, 2.0, 12.0)  # use special quad interp
 
         if isinstance(price, Dual):
             # use the inverse function theorem to express x as a Dual
-            p = self._price_from_ytm(Dual(x, ["y"], []), settlement, self.calc_mode, dirty)
-            return Dual(x, price.vars, 1 / gradient(p, ["y"])[0] * price.dual)
+            if last.get("y") == x:
+                # newton converged at this yield so its price gradient is already known
+                grad = last["grad"]
+            else:
+                p = self._price_from_ytm(Dual(x, ["y"], []), settlement, self.calc_mode, dirty)
+                grad = gradient(p, ["y"])[0]
+            return Dual(x, price.vars, 1 / grad * price.dual)
         elif isinstance(price, Dual2):
             # use the IFT in 2nd order to express x as a Dual2
             p = self._price_from_ytm(Dual2(x, ["y"], [], []), settlement, self.calc_mode, dirty)
-            dydP = 1 / gradient(p, ["y"])[0]
-            d2ydP2 = -gradient(p, ["y"], order=2)[0][0] * gradient(p, ["y"])[0] ** -3
+            dPdy = gradient(p, ["y"])[0]
+            dydP = 1 / dPdy
+            d2ydP2 = -gradient(p, ["y"], order=2)[0][0] * dPdy**-3
             dual = dydP * price.dual
             dual2 = 0.5 * (
                 dydP * gradient(price, price.vars, order=2)
-                + d2ydP2 * np.matmul(price.dual[:, None], price.dual[None, :])
+                + d2ydP2 * np.outer(price.dual, price.dual)
             )
 
             return Dual2(x, price.vars, dual.tolist(), list(dual2.flat))
@@ -2599,16 +2651,22 @@ class FixedRateBond(Sensitivities, BondMixin, BaseMixin):
            gilt.price(4.445, dt(1999, 5, 27))
            gilt.price(4.455, dt(1999, 5, 27))
         """
+        # accrued does not depend upon ``ytm`` so all metrics use the gradient of the dirty price
+        if metric == "risk" and not isinstance(self.fixed_rate, (Dual, Dual2)):
+            # complex step: the imaginary part of P(y + ih) is h * dP/dy to machine precision,
+            # using native complex arithmetic instead of AD when no other variables are present
+            h = 1e-100
+            return -self.price(complex(float(ytm), h), settlement, dirty=True).imag / h
+
+        price = self.price(Dual(float(ytm), ["y"], []), settlement, dirty=True)
+        grad = gradient(price, ["y"])[0]
         if metric == "risk":
-            _ = -gradient(self.price(Dual(float(ytm), ["y"], []), settlement), ["y"])[0]
+            _ = -grad
         elif metric == "modified":
-            price = -self.price(Dual(float(ytm), ["y"], []), settlement, dirty=True)
-            _ = -gradient(price, ["y"])[0] / float(price) * 100
+            _ = -grad / float(price) * 100
         elif metric == "duration":
-            price = self.price(Dual(float(ytm), ["y"], []), settlement, dirty=True)
-            f = 12 / defaults.frequency_months[self.kwargs["frequency"].upper()]
-            v = 1 + float(ytm) / (100 * f)
-            _ = -gradient(price, ["y"])[0] / float(price) * v * 100
+            v = 1 + float(ytm) / (100 * self._periods_per_year)
+            _ = -grad / float(price) * v * 100
         return _
 
     def convexity(self, ytm: float, settlement: datetime):
@@ -2650,9 +2708,63 @@ class FixedRateBond(Sensitivities, BondMixin, BaseMixin):
            gilt.duration(4.445, dt(1999, 5, 27))
            gilt.duration(4.455, dt(1999, 5, 27))
         """
-        _ = self.price(Dual2(float(ytm), ["y"], [], []), settlement)
+        _ = self.price(Dual2(float(ytm), ["y"], [], []), settlement, dirty=True)
         return gradient(_, ["y"], 2)[0][0]
 
+    def metrics(self, ytm: float, settlement: datetime):
+        """
+        Return the prices, accrued and ``ytm`` sensitivities of the bond from a single pricing.
+
+        Parameters
+        ----------
+        ytm : float
+            The yield-to-maturity for the bond.
+        settlement : datetime
+            The settlement date of the bond.
+
+        Returns
+        -------
+        dict
+
+        Notes
+        -----
+        The dirty price is determined once with a second order AD ``ytm``, from which
+        each of the values of :meth:`~rateslib.instruments.FixedRateBond.price`,
+        :meth:`~rateslib.instruments.FixedRateBond.accrued`,
+        :meth:`~rateslib.instruments.FixedRateBond.duration` (for each ``metric``) and
+        :meth:`~rateslib.instruments.FixedRateBond.convexity` are derived. This is more
+        efficient than calling each method separately when all are required.
+
+        Examples
+        --------
+        .. ipython:: python
+
+           gilt = FixedRateBond(
+               effective=dt(1998, 12, 7),
+               termination=dt(2015, 12, 7),
+               frequency="S",
+               calendar="ldn",
+               currency="gbp",
+               convention="ActActICMA",
+               ex_div=7,
+               fixed_rate=8.0
+           )
+           gilt.metrics(4.445, dt(1999, 5, 27))
+        """
+        dirty_price = self.price(Dual2(float(ytm), ["y"], [], []), settlement, dirty=True)
+        accrued = self.accrued(settlement)
+        price, grad = float(dirty_price), gradient(dirty_price, ["y"])[0]
+        v = 1 + float(ytm) / (100 * self._periods_per_year)
+        return {
+            "clean_price": price - float(accrued),
+            "dirty_price": price,
+            "accrued": accrued,
+            "risk": -grad,
+            "modified": -grad / price * 100,
+            "duration": -grad / price * v * 100,
+            "convexity": gradient(dirty_price, ["y"], 2)[0][0],
+        }
+
     def price(self, ytm: float, settlement: datetime, dirty: bool = False):
         """
         Calculate the price of the security per nominal value of 100, given
@@ -2861,6 +2973,7 @@ class IndexFixedRateBond(FixedRateBond):
         self.leg1 = IndexFixedLeg(
             **_get(self.kwargs, leg=1, filter=["ex_div", "settle", "calc_mode"]),
         )
+        self._periods_per_year = 12 / defaults.frequency_months[self.kwargs["frequency"].upper()]
         if self.leg1.amortization != 0:
             # Note if amortization is added to IndexFixedRateBonds must systematically
             # go through and update all methods. Many rely on the quantity
@@ -2954,11 +3067,7 @@ class IndexFixedRateBond(FixedRateBond):
             "index_dirty_price",
         ]:
             if forward_settlement is NoInput.blank:
-                settlement = self.leg1.schedule.calendar.lag(
-                    curves[1].node_dates[0],
-                    self.kwargs["settle"],
-                    True,
-                )
+                settlement = self._settlement_from_curve(curves[1])
             else:
                 settlement = forward_settlement
             npv = self._npv_local(curves[0], curves[1], settlement, settlement)
@@ -3172,6 +3281,8 @@ class Bill(FixedRateBond):
             defaults.spec[getattr(self, f"_{self.kwargs['calc_mode']}")["ytm_clone"]]["frequency"],
             frequency,
         )
+        # the yield compounding frequency is that of the ytm_clone, not the "z" schedule
+        self._periods_per_year = 12 / defaults.frequency_months[self.kwargs["frequency"].upper()]
 
     @property
     def dcf(self):
@@ -3181,6 +3292,20 @@ class Bill(FixedRateBond):
             d += self.leg1.periods[i].dcf
         return d
 
+    def _settlement_dcf(self, settlement: datetime):
+        """
+        The day count fraction from ``settlement`` to maturity, shared by the rate and price
+        conversions and cached for the last ``settlement`` so that repeated conversions do not
+        recompute the accrual fraction.
+        """
+        key = (settlement, self.calc_mode)
+        cache = getattr(self, "_settlement_dcf_cache", None)
+        if cache is None or cache[0] != key:
+            acc_frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, 0)
+            cache = (key, (1 - acc_frac) * self.dcf)
+            self._settlement_dcf_cache = cache
+        return cache[1]
+
     def rate(
         self,
         curves: Curve | str | list | NoInput = NoInput(0),
@@ -3227,17 +3352,10 @@ class Bill(FixedRateBond):
             base,
             self.leg1.currency,
         )
-        settlement = self.leg1.schedule.calendar.lag(
-            curves[1].node_dates[0],
-            self.kwargs["settle"],
-            True,
-        )
-        # scale price to par 100 and make a fwd adjustment according to curve
-        price = (
-            self.npv(curves, solver, fx_, base_)
-            * 100
-            / (-self.leg1.notional * curves[1][settlement])
-        )
+        settlement = self._settlement_from_curve(curves[1])
+        npv = self._npv_local(curves[0], curves[1], settlement, settlement)
+        # scale price to par 100 (npv is already projected forward to settlement)
+        price = npv * 100 / -self.leg1.notional
         if metric in ["price", "clean_price", "dirty_price"]:
             return price
         elif metric == "discount_rate":
@@ -3263,8 +3381,7 @@ class Bill(FixedRateBond):
         -------
         float, Dual, or Dual2
         """
-        acc_frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, 0)
-        dcf = (1 - acc_frac) * self.dcf
+        dcf = self._settlement_dcf(settlement)
         return ((100 / price - 1) / dcf) * 100
 
     def discount_rate(self, price: DualTypes, settlement: datetime) -> DualTypes:
@@ -3282,8 +3399,7 @@ class Bill(FixedRateBond):
         -------
         float, Dual, or Dual2
         """
-        acc_frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, 0)
-        dcf = (1 - acc_frac) * self.dcf
+        dcf = self._settlement_dcf(settlement)
         rate = ((1 - price / 100) / dcf) * 100
         return rate
 
@@ -3321,13 +3437,11 @@ class Bill(FixedRateBond):
         return price_func(rate, settlement)
 
     def _price_discount(self, rate: DualTypes, settlement: datetime):
-        acc_frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, 0)
-        dcf = (1 - acc_frac) * self.dcf
+        dcf = self._settlement_dcf(settlement)
         return 100 - rate * dcf
 
     def _price_simple(self, rate: DualTypes, settlement: datetime):
-        acc_frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, 0)
-        dcf = (1 - acc_frac) * self.dcf
+        dcf = self._settlement_dcf(settlement)
         return 100 / (1 + rate * dcf / 100)
 
     def ytm(
@@ -3601,6 +3715,57 @@ class FloatRateNote(Sensitivities, BondMixin, BaseMixin):
             # self.notional which is currently assumed to be a fixed quantity
             raise NotImplementedError("`amortization` for FloatRateNote must be zero.")
 
+    def _ibor_dummy_curve(self, period: FloatPeriod):
+        """
+        Return a flat dummy *Curve* over ``period`` from which ``rate()`` will return the
+        fixing. Cached by the period dates to avoid rebuilding a *Curve* on every accrued call.
+        """
+        key = (period.start, period.end)
+        cache = getattr(self, "_ibor_dummy_curve_cache", None)
+        if cache is None or cache[0] != key:
+            cache = (key, Curve({period.start: 1.0, period.end: 1.0}))
+            self._ibor_dummy_curve_cache = cache
+        return cache[1]
+
+    def _accrued_period(self, settlement: datetime, acc_idx: int):
+        """
+        Return the pseudo *FloatPeriod* accruing from the start of the ``acc_idx`` period to
+        ``settlement``, cached for the last inputs since accrued is repeatedly called with the
+        same ``settlement``, for example when iterating a yield or a margin.
+        """
+        leg1 = self.leg1
+        fixings = leg1.fixings[acc_idx]
+        cache = getattr(self, "_accrued_period_cache", None)
+        if (
+            cache is not None
+            and cache[0] == (settlement, acc_idx)
+            and cache[1] is fixings
+            and cache[2] is self.float_spread
+        ):
+            return cache[3]
+
+        schedule = leg1.schedule
+        p = FloatPeriod(
+            start=schedule.aschedule[acc_idx],
+            end=settlement,
+            payment=settlement,
+            frequency=schedule.frequency,
+            notional=-100,
+            currency=leg1.currency,
+            convention=leg1.convention,
+            termination=schedule.aschedule[acc_idx + 1],
+            stub=True,
+            float_spread=self.float_spread,
+            fixing_method=leg1.fixing_method,
+            fixings=fixings,
+            method_param=leg1.method_param,
+            spread_compound_method=leg1.spread_compound_method,
+            roll=schedule.roll,
+            calendar=schedule.calendar,
+        )
+        self._accrued_period_cache = ((settlement, acc_idx), fixings, self.float_spread, p)
+        return p
+
     def _accrual_rate(self, pseudo_period, curve, method_param):
         """
         Take a period and try to forecast the rate which determines the accrual,
@@ -3764,58 +3929,32 @@ class FloatRateNote(Sensitivities, BondMixin, BaseMixin):
         if self.leg1.fixing_method == "ibor":
             acc_idx = self._period_index(settlement)
             frac = getattr(self, f"_{self.calc_mode}")["accrual"](settlement, acc_idx)
-            if self.ex_div(settlement):
+            if self._ex_div_in_period(settlement, acc_idx):
                 frac = frac - 1  # accrued is negative in ex-div period
 
+            period = self.leg1.periods[acc_idx]
             if curve is not NoInput.blank:
                 curve_ = curve
+            elif isinstance(period.fixings, (float, Dual, Dual2)):
+                curve_ = NoInput(0)  # rate() returns a scalar fixing without using a curve
             else:
-                curve_ = Curve(
-                    {  # create a dummy curve. rate() will return the fixing
-                        self.leg1.periods[acc_idx].start: 1.0,
-                        self.leg1.periods[acc_idx].end: 1.0,
-                    },
-                )
-            rate = self.leg1.periods[acc_idx].rate(curve_)
+                curve_ = self._ibor_dummy_curve(period)
+            rate = period.rate(curve_)
 
-            cashflow = (
-                -self.leg1.periods[acc_idx].notional * self.leg1.periods[acc_idx].dcf * rate / 100
-            )
+            cashflow = -period.notional * period.dcf * rate / 100
             return frac * cashflow / -self.leg1.notional * 100
         else:  # is "rfr"
-            acc_idx = index_left(
-                self.leg1.schedule.aschedule,
-                len(self.leg1.schedule.aschedule),
-                settlement,
-            )
-            p = FloatPeriod(
-                start=self.leg1.schedule.aschedule[acc_idx],
-                end=settlement,
-                payment=settlement,
-                frequency=self.leg1.schedule.frequency,
-                notional=-100,
-                currency=self.leg1.currency,
-                convention=self.leg1.convention,
-                termination=self.leg1.schedule.aschedule[acc_idx + 1],
-                stub=True,
-                float_spread=self.float_spread,
-                fixing_method=self.leg1.fixing_method,
-                fixings=self.leg1.fixings[acc_idx],
-                method_param=self.leg1.method_param,
-                spread_compound_method=self.leg1.spread_compound_method,
-                roll=self.leg1.schedule.roll,
-                calendar=self.leg1.schedule.calendar,
-            )
-            rate_to_settle = self._accrual_rate(p, curve, self.leg1.method_param)
+            leg1 = self.leg1
+            aschedule = leg1.schedule.aschedule
+            acc_idx = index_left(aschedule, len(aschedule), settlement)
+            p = self._accrued_period(settlement, acc_idx)
+            rate_to_settle = self._accrual_rate(p, curve, leg1.method_param)
             accrued_to_settle = 100 * p.dcf * rate_to_settle / 100
 
             if self.ex_div(settlement):
-                rate_to_end = self._accrual_rate(
-                    self.leg1.periods[acc_idx],
-                    curve,
-                    self.leg1.method_param,
-                )
-                accrued_to_end = 100 * self.leg1.periods[acc_idx].dcf * rate_to_end / 100
+                period = leg1.periods[acc_idx]
+                rate_to_end = self._accrual_rate(period, curve, leg1.method_param)
+                accrued_to_end = 100 * period.dcf * rate_to_end / 100
                 return accrued_to_settle - accrued_to_end
             else:
                 return accrued_to_settle
@@ -3876,11 +4015,7 @@ class FloatRateNote(Sensitivities, BondMixin, BaseMixin):
         metric = metric.lower()
         if metric in ["clean_price", "dirty_price", "spread"]:
             if forward_settlement is NoInput.blank:
-                settlement = self.leg1.schedule.calendar.lag(
-                    curves[1].node_dates[0],
-                    self.kwargs["settle"],
-                    True,
-                )
+                settlement = self._settlement_from_curve(curves[1])
             else:
                 settlement = forward_settlement
             npv = self._npv_local(curves[0], curves[1], settlement, settlement)
@@ -5038,36 +5173,6 @@ class BaseDerivative(Sensitivities, BaseMixin, metaclass=ABCMeta):
         self.curves = curves
         self.spec = spec
 
-        #
-        # for attribute in [
-        #     "effective",
-        #     "termination",
-        #     "frequency",
-        #     "stub",
-        #     "front_stub",
-        #     "back_stub",
-        #     "roll",
-        #     "eom",
-        #     "modifier",
-        #     "calendar",
-        #     "payment_lag",
-        #     "convention",
-        #     "notional",
-        #     "amortization",
-        #     "currency",
-        # ]:
-        #     leg2_val, val = self.kwargs[f"leg2_{attribute}"], self.kwargs[attribute]
-        #     if leg2_val is NoInput.inherit:
-        #         _ = val
-        #     elif leg2_val == NoInput.negate:
-        #         _ = NoInput(0) if val is NoInput(0) else val * -1
-        #     else:
-        #         _ = leg2_val
-        #     self.kwargs[attribute] = val
-        #     self.kwargs[f"leg2_{attribute}"] = _
-        #     # setattr(self, attribute, val)
-        #     # setattr(self, f"leg2_{attribute}", _)
-
     @abstractmethod
     def _set_pricing_mid(self, *args, **kwargs):  # pragma: no cover
         pass
@@ -5417,8 +5522,6 @@ class IRS(BaseDerivative):
         to ``irs.spread`` is different to the previous call, albeit the difference
         is 1/10000th of a basis point.
         """
-        irs_npv = self.npv(curves, solver)
-        specified_spd = 0 if self.leg2.float_spread is NoInput(0) else self.leg2.float_spread
         curves, _, _ = _get_curves_fx_and_base_maybe_from_solver(
             self.curves,
             solver,
@@ -5427,6 +5530,9 @@ class IRS(BaseDerivative):
             base,
             self.leg1.currency,
         )
+        # curves are already resolved from the solver so do not resolve them again for npv
+        irs_npv = self.npv(curves)
+        specified_spd = 0 if self.leg2.float_spread is NoInput(0) else self.leg2.float_spread
         return self.leg2._spread(-irs_npv, curves[2], curves[3]) + specified_spd
         # leg2_analytic_delta = self.leg2.analytic_delta(curves[2], curves[3])
         # return irs_npv / leg2_analytic_delta + specified_spd
@@ -6059,8 +6165,6 @@ class IIRS(BaseDerivative):
         to ``irs.spread`` is different to the previous call, albeit the difference
         is 1/10000th of a basis point.
         """
-        irs_npv = self.npv(curves, solver)
-        specified_spd = 0 if self.leg2.float_spread is NoInput.blank else self.leg2.float_spread
         curves, _, _ = _get_curves_fx_and_base_maybe_from_solver(
             self.curves,
             solver,
@@ -6069,6 +6173,9 @@ class IIRS(BaseDerivative):
             base,
             self.leg1.currency,
         )
+        # curves are already resolved from the solver so do not resolve them again for npv
+        irs_npv = self.npv(curves)
+        specified_spd = 0 if self.leg2.float_spread is NoInput.blank else self.leg2.float_spread
         return self.leg2._spread(-irs_npv, curves[2], curves[3]) + specified_spd
 
 
@@ -10151,8 +10258,11 @@ class Portfolio(Sensitivities):
             local=local,
             **kwargs,
         )
+        # instruments are of similar cost so statically chunk them, one chunk per process,
+        # which pickles the (possibly large) curves and solver in ``func`` once per process.
+        chunksize = -(-len(self.instruments) // defaults.pool)
         p = Pool(defaults.pool)
-        results = p.map(func, self.instruments)
+        results = p.map(func, self.instruments, chunksize=max(1, chunksize))
         p.close()
 
         if local:
@@ -10331,6 +10441,32 @@ def _ytm_quadratic_converger2(f, y0, y1, y2, f0=None, f1=None, f2=None, tol=1e-9
         )  # pragma: no cover
 
 
+def _ytm_newton(f, y0, tol=1e-9, max_iter=20):
+    """
+    Determine the yield, from an initial guess `y0`, at which the price from yield
+    difference returned by `f`, alongside its derivative, is zero, by Newton iteration.
+
+    Returns None if the iterations do not converge to a valid yield, in which case a
+    bracketing method should be used.
+    """
+    y, step, growths = y0, None, 0
+    for _ in range(max_iter):
+        f_, df_ = f(y)
+        if abs(f_) < tol:
+            return y
+        if df_ == 0:
+            return None
+        step, prev_step = abs(f_ / df_), step
+        if prev_step is not None and step > prev_step:
+            growths += 1
+            if growths == 2:
+                return None  # the iterations are diverging
+        y = y - f_ / df_
+        if not -99.0 < y < 10000.0:
+            return None
+    return None
+
+
 def _get(kwargs: dict, leg: int = 1, filter=[]):
     """
     A parser to return kwarg dicts for relevant legs.
@@ -10388,11 +10524,9 @@ def _inherit_or_negate(kwargs: dict, ignore_blank=False):
     """Amend the values of leg2 kwargs if they are defaulted to inherit or negate from leg1."""
 
     def _replace(k, v):
-        # either inherit or negate the value in leg2 from that in leg1
-        if "leg2_" in k:
-            if not isinstance(v, NoInput):
-                return v  # do nothing if the attribute is an input
-
+        # either inherit or negate the value in leg2 from that in leg1. Inputs and blanks are
+        # returned unchanged so only the inherit and negate sentinels are tested.
+        if (v is NoInput.inherit or v is NoInput.negate) and k.startswith("leg2_"):
             try:
                 leg1_v = kwargs[k[5:]]
             except KeyError:
@@ -10404,11 +10538,11 @@ def _inherit_or_negate(kwargs: dict, ignore_blank=False):
                 else:
                     return NoInput(0)
 
-            if v is NoInput(-1):
+            if v is NoInput.negate:
                 return leg1_v * -1.0
-            elif v is NoInput(1):
+            else:
                 return leg1_v
-        return v  # do nothing to leg1 attributes
+        return v  # do nothing to leg1 attributes or leg2 inputs
 
     return {k: _replace(k, v) for k, v in kwargs.items()}
 
@@ -11,7 +11,6 @@ from pandas.tseries.offsets import CustomBusinessDay
 
 from rateslib import defaults
 from rateslib.calendars import (
-    _adjust_date,
     _get_modifier,
     _get_roll,
     _get_rollday,
@@ -539,10 +538,13 @@ class Schedule:
 
     def _attribute_schedules(self):
         """Attributes additional schedules according to date adjust and payment lag."""
-        self.aschedule = [_adjust_date(dt, self.modifier, self.calendar) for dt in self.uschedule]
-        self.pschedule = [
-            self.calendar.lag(dt, self.payment_lag, settlement=True) for dt in self.aschedule
-        ]
+        # the calendar and modifier are resolved once and both schedules built in one pass
+        cal_, modifier = self.calendar, _get_modifier(self.modifier, True)
+        self.aschedule, self.pschedule = [], []
+        for dt in self.uschedule:
+            adt = cal_.roll(dt, modifier, True)
+            self.aschedule.append(adt)
+            self.pschedule.append(cal_.lag(adt, self.payment_lag, settlement=True))
         self.stubs = [False] * (len(self.uschedule) - 1)
         if self.front_stub is not NoInput(0):
             self.stubs[0] = True
@@ -896,8 +898,9 @@ def _is_invalid_very_short_stub(
     window.
     """
     # _ = date_range(start=date1, end=date2, freq=calendar)
-    date1_ = calendar.roll(date_to_modify, _get_modifier(modifier, True), settlement=False)
-    date2_ = calendar.roll(date_fixed, _get_modifier(modifier, True), settlement=False)
+    modifier_ = _get_modifier(modifier, True)
+    date1_ = calendar.roll(date_to_modify, modifier_, settlement=False)
+    date2_ = calendar.roll(date_fixed, modifier_, settlement=False)
     # settlement calendar alignment is not enforced during schedule generation.
     return date1_ == date2_  # True => date range created by stubs is too small and is invalid
 
@@ -1314,12 +1317,13 @@ def _get_unadjusted_short_stub_date(
                 _ = _get_roll(_.month, _.year, roll)
 
     else:
+        modifier, rollday = _get_modifier("NONE", True), _get_rollday(roll)
         for month_offset in range(1, 12):
             stub_date = cal_.add_months(
                 stub_side_dt,
                 month_offset * direction,
-                _get_modifier("NONE", True),
-                _get_rollday(roll),
+                modifier,
+                rollday,
                 False,
             )
             if _is_divisible_months(stub_date, reg_side_dt, frequency_months):
@@ -1421,14 +1425,10 @@ def _generate_regular_schedule_unadjusted(
     _ = ueffective
     yield _
     cal_ = get_calendar(NoInput(0))
+    months = defaults.frequency_months[frequency]
+    modifier, rollday = _get_modifier("NONE", True), _get_rollday(roll)
     for _i in range(int(n_periods)):
-        _ = cal_.add_months(
-            _,
-            defaults.frequency_months[frequency],
-            _get_modifier("NONE", True),
-            _get_rollday(roll),
-            False,
-        )
+        _ = cal_.add_months(_, months, modifier, rollday, False)
         # _ = _get_roll(_.month, _.year, roll)
         yield _
 
@@ -1456,17 +1456,18 @@ def _get_unadjusted_date_alternatives(date: datetime, modifier: str, cal: Custom
     unadj_dates = [date]
     if cal.is_non_bus_day(date):
         return unadj_dates  # no other unadjusted date can adjust to a holiday.
+    modifier_ = _get_modifier(modifier, True)
     for days in range(1, 20):
         possible_unadjusted_date = date + timedelta(days=days)
         if cal.is_bus_day(possible_unadjusted_date):
             break  # if a business day, no later date will adjust back to date.
-        if date == _adjust_date(possible_unadjusted_date, modifier, cal):
+        if date == cal.roll(possible_unadjusted_date, modifier_, True):
             unadj_dates.append(possible_unadjusted_date)
     for days in range(1, 20):
         possible_unadjusted_date = date - timedelta(days=days)
         if cal.is_bus_day(possible_unadjusted_date):
             break  # if a business day, no previous date will adjust back to date.
-        if date == _adjust_date(possible_unadjusted_date, modifier, cal):
+        if date == cal.roll(possible_unadjusted_date, modifier_, True):
             unadj_dates.append(possible_unadjusted_date)
     return unadj_dates
 
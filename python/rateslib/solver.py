@@ -990,6 +990,7 @@ class Solver(Gradients):
 
         # aggregate and organise variables and labels including pre_solvers
         self.pre_curves = {}
+        self._curves_cache = {}  # depends on self.pre_curves
         self.pre_variables = ()
         self.pre_instrument_labels = ()
         self.pre_instruments = ()
@@ -1044,6 +1045,19 @@ class Solver(Gradients):
         }
         self.iterate()
 
+    def _resolve_str_curves(self, curves: tuple[str, ...]) -> tuple:
+        """
+        Return the *Curves* in ``pre_curves`` with the given str ``curves`` ids.
+
+        The result is cached by the tuple of ids. Raises KeyError if an id is not found.
+        """
+        try:
+            return self._curves_cache[curves]
+        except KeyError:
+            curves_ = tuple(self.pre_curves[curve] for curve in curves)
+            self._curves_cache[curves] = curves_
+            return curves_
+
     def _parse_instrument(self, value):
         """
         Parses different input formats for an instrument given to the ``Solver``.
@@ -1,30 +1,41 @@
 from __future__ import annotations
 
+import numpy as np
+
 from rateslib.dual import Dual, Dual2
-from rateslib.rs import PPSplineDual, PPSplineDual2, PPSplineF64, bspldnev_single, bsplev_single
+from rateslib.rs import (
+    PPSplineDual,
+    PPSplineDual2,
+    PPSplineF64,
+    bspldnev_single,
+    bsplev_single,
+    ppdnev_dual_into,
+    ppdnev_f32,
+)
 from rateslib.rs import PPSplineF64 as PPSpline
+from rateslib.rs import evaluate as _evaluate
 
 # for legacy reasons allow a PPSpline class which allows only f64 datatypes.
 # TODO: (depr) remove this for version 2.0
 
 # bspldnev_single.__doc__ = "Calculate the *m* th order derivative (from the right) of an indexed b-spline at *x*."  # noqa: E501
 # bsplev_single.__doc__ = "Calculate the value of an indexed b-spline at *x*."
-PPSplineF64.__doc__ = "Piecewise polynomial spline composed of float values on the x and y axes."
-PPSplineDual.__doc__ = "Piecewise polynomial spline composed of float values on the x-axis and Dual values on the y-axis."  # noqa: E501
-PPSplineDual2.__doc__ = "Piecewise polynomial spline composed of float values on the x-axis and Dual2 values on the y-axis."  # noqa: E501
 
 
 def evaluate(
     spline: PPSplineF64 | PPSplineDual | PPSplineDual2,
-    x: float | Dual | Dual2,
+    x: float | Dual | Dual2 | np.ndarray,
     m: int = 0,
-) -> float | Dual | Dual2:
+) -> float | Dual | Dual2 | np.ndarray:
     """
     Evaluate a single x-axis data point, or a derivative value, on a *Spline*.
 
     This method automatically calls :meth:`~rateslib.splines.PPSplineF64.ppdnev_single`,
     :meth:`~rateslib.splines.PPSplineF64.ppdnev_single_dual` or
     :meth:`~rateslib.splines.PPSplineF64.ppdnev_single_dual2`  based on the input form of ``x``.
+    If ``x`` is a 1-d array it is evaluated with :meth:`~rateslib.splines.evaluate_many`,
+    unless it is of dtype *float32* and ``spline`` is a *PPSplineF64*, in which case it is
+    evaluated in single precision and an array of *float32* is returned.
 
     This method is AD safe.
 
@@ -32,8 +43,81 @@ def evaluate(
     ----------
     spline: PPSplineF64, PPSplineDual, PPSplineDual2
         The *Spline* on which to evaluate the data point.
+    x: float, Dual, Dual2, 1-d array
+        The x-axis data point, or points, to evaluate.
+    m: int, optional
+        The order of derivative to evaluate. If seeking value only use *m=0*.
+
+    Returns
+    -------
+    float, Dual, Dual2, or 1-d array of such
+    """
+    if isinstance(x, np.ndarray) and x.ndim == 1:
+        if x.dtype == np.float32 and isinstance(spline, PPSplineF64):
+            return ppdnev_f32(spline, x, m)
+        return np.array(evaluate_many(spline, x, m))
+    # type dispatch on scalars is performed in the compiled extension.
+    return _evaluate(spline, x, m)
+
+
+def evaluate_many(
+    spline: PPSplineF64 | PPSplineDual | PPSplineDual2,
+    x: list[float | Dual | Dual2] | np.ndarray,
+    m: int = 0,
+) -> list[float | Dual | Dual2]:
+    """
+    Evaluate an array of x-axis data points, or derivative values, on a *Spline*.
+
+    If every element of ``x`` is a *float* the array is evaluated with a single call to
+    :meth:`~rateslib.splines.PPSplineF64.ppdnev`. Otherwise each element is evaluated
+    individually with :meth:`~rateslib.splines.evaluate`.
+
+    This method is AD safe.
+
+    Parameters
+    ----------
+    spline: PPSplineF64, PPSplineDual, PPSplineDual2
+        The *Spline* on which to evaluate the data points.
+    x: 1-d array of float, Dual, Dual2
+        The x-axis data points to evaluate.
+    m: int, optional
+        The order of derivative to evaluate. If seeking value only use *m=0*.
+
+    Returns
+    -------
+    list of float, Dual, Dual2
+    """
+    if isinstance(x, np.ndarray) and x.dtype != object:
+        return spline.ppdnev(x, m)
+    elif any(isinstance(_, (Dual, Dual2)) for _ in x):
+        # elements are scalars so call the compiled dispatch directly, bypassing `evaluate`.
+        return [_evaluate(spline, _, m) for _ in x]
+    else:
+        return spline.ppdnev(x, m)
+
+
+def evaluate_dot(
+    spline: PPSplineF64 | PPSplineDual | PPSplineDual2,
+    x: float | Dual | Dual2,
+    weights: list[float] | np.ndarray,
+    m: int = 0,
+) -> float | Dual | Dual2:
+    """
+    Evaluate the dot product of the b-spline values, or derivative values, with given weights.
+
+    This is equivalent to evaluating a spline with the same knots and coefficients
+    ``weights`` at ``x``, and calls :meth:`~rateslib.splines.PPSplineF64.ppdnev_dot`.
+
+    This method is AD safe with respect to ``x``.
+
+    Parameters
+    ----------
+    spline: PPSplineF64, PPSplineDual, PPSplineDual2
+        The *Spline* whose b-splines are evaluated.
     x: float, Dual, Dual2
         The x-axis data point to evaluate.
+    weights: 1-d array of float
+        The weight of each b-spline, of length ``spline.n``.
     m: int, optional
         The order of derivative to evaluate. If seeking value only use *m=0*.
 
@@ -41,12 +125,49 @@ def evaluate(
     -------
     float, Dual, Dual2
     """
-    if isinstance(x, Dual):
-        return spline.ppdnev_single_dual(x, m)
-    elif isinstance(x, Dual2):
-        return spline.ppdnev_single_dual2(x, m)
-    else:
-        return spline.ppdnev_single(x, m)
+    return spline.ppdnev_dot(x, weights, m)
+
+
+def evaluate_into(
+    spline: PPSplineF64,
+    x: np.ndarray,
+    x_grad: np.ndarray,
+    out: np.ndarray,
+    out_grad: np.ndarray,
+    m: int = 0,
+) -> None:
+    """
+    Evaluate an array of *Dual* x-axis data points on a *Spline*, writing into given arrays.
+
+    Each *Dual* is represented by its real component, ``x[i]``, and its gradient,
+    ``x_grad[i, :]``, so that no *Dual* objects are created. The result for each point
+    is written into ``out[i]`` and ``out_grad[i, :]``, and is equivalent to the real component
+    and gradient of :meth:`~rateslib.splines.evaluate` with the equivalent *Dual*.
+
+    Parameters
+    ----------
+    spline: PPSplineF64
+        The *Spline* on which to evaluate the data points.
+    x: 1-d array of float
+        The real components of the x-axis data points.
+    x_grad: 2-d array of float
+        The gradients of the x-axis data points, one row per point.
+    out: 1-d array of float
+        The array into which the real components of the result are written.
+    out_grad: 2-d array of float
+        The array into which the gradients of the result are written, one row per point.
+    m: int, optional
+        The order of derivative to evaluate. If seeking value only use *m=0*.
+
+    Returns
+    -------
+    None
+    """
+    if x.ndim != 1 or x_grad.ndim != 2 or out.shape != x.shape:
+        raise ValueError("`x` and `out` must be 1-d arrays and `x_grad` a 2-d array.")
+    if x_grad.shape[0] != x.shape[0] or out_grad.shape != x_grad.shape:
+        raise ValueError("`x_grad` and `out_grad` must have shape (len(x), number of variables).")
+    ppdnev_dual_into(spline, x, x_grad, out, out_grad, m)
 
 
 __all__ = (
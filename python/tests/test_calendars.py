@@ -16,6 +16,7 @@ from rateslib.calendars import (
     add_tenor,
     create_calendar,
     dcf,
+    dcf_vec,
     get_calendar,
     get_imm,
 )
@@ -96,6 +97,12 @@ def test_add_tenor_raises() -> None:
         add_tenor(dt(2022, 1, 1), "1X", "mf", None)
 
 
+@pytest.mark.parametrize("tenor", ["10BD", "M", "1M3D", "1.5M", "Y1"])
+def test_add_tenor_malformed_raises(tenor) -> None:
+    with pytest.raises(ValueError):
+        add_tenor(dt(2022, 1, 1), tenor, "mf", "bus")
+
+
 @pytest.mark.parametrize(
     ("tenor", "expected"),
     [
@@ -106,6 +113,8 @@ def test_add_tenor_raises() -> None:
         ("32d", dt(2022, 2, 1)),
         ("1y", dt(2022, 12, 31)),
         ("0.5y", dt(2022, 6, 30)),
+        (".5Y", dt(2022, 6, 30)),
+        (" 3M", dt(2022, 3, 31)),
     ],
 )
 def test_add_tenor(tenor, expected) -> None:
@@ -154,6 +163,9 @@ def test_add_tenor_special_cases(date, tenor, mod, roll, cal, expected) -> None:
         (2, 2022, dt(2022, 2, 28)),
         (2, 2024, dt(2024, 2, 29)),
         (8, 2022, dt(2022, 8, 31)),
+        (2, 2000, dt(2000, 2, 29)),
+        (2, 2100, dt(2100, 2, 28)),
+        (12, 2100, dt(2100, 12, 31)),
     ],
 )
 def test_get_eom(month, year, expected) -> None:
@@ -283,6 +295,8 @@ def test_is_eom_som(date, expected) -> None:
         (dt(2022, 1, 1), dt(2022, 4, 1), "30E360", 0.250),
         (dt(2022, 1, 1), dt(2022, 4, 1), "ACTACT", 0.2465753424657534),
         (dt(2022, 1, 1), dt(2022, 1, 1), "ACTACT", 0.0),
+        (dt(2019, 10, 1), dt(2021, 3, 1), "ACTACTISDA", 92 / 365 + 1.0 + 59 / 365),
+        (dt(2019, 10, 1, 12), dt(2020, 3, 1, 6), "ACTACTISDA", 92 / 365 + 60 / 366),
         (dt(2022, 1, 1), dt(2023, 1, 31), "1+", 1.0),
         (dt(2022, 1, 1), dt(2024, 2, 28), "1+", 2 + 1 / 12),
         (dt(2022, 1, 1), dt(2022, 4, 1), "BUS252", 0.35714285714285715),
@@ -293,6 +307,32 @@ def test_dcf(start, end, conv, expected) -> None:
     assert abs(result - expected) < 1e-14
 
 
+@pytest.mark.parametrize(
+    "conv", ["ACT365F", "Act360", "30360", "30E360", "BONDBASIS", "EUROBONDBASIS", "1", "1+"]
+)
+def test_dcf_vec(conv) -> None:
+    start = [dt(2022, 1, 1), dt(2022, 6, 30), dt(2022, 1, 31), dt(2020, 2, 29), dt(2021, 5, 15)]
+    end = [dt(2022, 4, 1), dt(2022, 7, 31), dt(2022, 3, 31), dt(2024, 2, 29), dt(2021, 5, 15)]
+    result = dcf_vec(start, end, conv)
+    expected = [dcf(s, e, conv) for s, e in zip(start, end)]
+    assert all(abs(r - e) < 1e-14 for r, e in zip(result, expected))
+
+
+@pytest.mark.parametrize("conv", ["ACT365F", "Act360", "30360", "30E360", "1+"])
+def test_dcf_vec_time_component(conv) -> None:
+    # whole days are counted as by dcf, which uses timedelta.days
+    start = [dt(2022, 1, 1, 18), dt(2022, 6, 30, 6), dt(1969, 12, 31, 18)]
+    end = [dt(2022, 1, 2, 6), dt(2022, 7, 31, 18), dt(1970, 3, 1, 6)]
+    result = dcf_vec(start, end, conv)
+    expected = [dcf(s, e, conv) for s, e in zip(start, end)]
+    assert all(abs(r - e) < 1e-14 for r, e in zip(result, expected))
+
+
+def test_dcf_vec_raises() -> None:
+    with pytest.raises(ValueError, match="`convention` must be in"):
+        dcf_vec([dt(2022, 1, 1)], [dt(2022, 4, 1)], "ACTACTICMA")
+
+
 @pytest.mark.parametrize(
     ("start", "end", "conv", "expected", "freq_m", "term", "stub"),
     [
@@ -474,6 +514,20 @@ def test_act_act_icma_z_freq(s, e, t, exp) -> None:
     assert abs(result - exp) < 1e-6
 
 
+def test_act_act_icma_stub_cached_independent_of_calendar() -> None:
+    args = dict(
+        start=dt(2022, 1, 17),
+        end=dt(2022, 6, 30),
+        termination=dt(2022, 6, 30),
+        frequency_months=6,
+        stub=True,
+        roll=NoInput(0),
+    )
+    expected = _dcf_actacticma(**args, calendar=NoInput(0))
+    assert _dcf_actacticma(**args, calendar="tgt") == expected
+    assert _dcf_actacticma(**args, calendar=get_calendar("ldn,nyc")) == expected
+
+
 def test_calendar_aligns_with_fixings_tyo() -> None:
     # using this test in a regular way, and with "-W error" for error on warn ensures that:
     #  - Curve cal is a business  day and fixings cal has no fixing: is a warn
@@ -599,3 +653,36 @@ def test_is_day_type_tenor(tenor):
 @pytest.mark.parametrize("tenor", ["1M", "1m", "4Y", "4y"])
 def test_is_not_day_type_tenor(tenor):
     assert not _is_day_type_tenor(tenor)
+
+
+def test_get_calendar_named_cached() -> None:
+    result = get_calendar("tgt,nyc")
+    assert result is get_calendar("tgt,nyc")
+    assert result == get_calendar("tgt,nyc", named=False)
+
+
+def test_add_tenor_cached_custom_calendar_not_stale() -> None:
+    # a user defined calendar name is not cached and so reflects updates to defaults
+    defaults.calendars["custom2"] = Cal([dt(2023, 1, 3)], [5, 6])
+    assert add_tenor(dt(2023, 1, 2), "1b", "F", "custom2") == dt(2023, 1, 4)
+    defaults.calendars["custom2"] = Cal([], [5, 6])
+    assert add_tenor(dt(2023, 1, 2), "1b", "F", "custom2") == dt(2023, 1, 3)
+
+
+def test_add_tenor_cached_named_calendar() -> None:
+    expected = add_tenor(dt(2023, 1, 2), "3m", "MF", get_calendar("ldn", named=False))
+    assert add_tenor(dt(2023, 1, 2), "3m", "MF", "ldn") == expected
+    assert add_tenor(dt(2023, 1, 2), "3m", "MF", "ldn") == expected
+
+
+@pytest.mark.parametrize("cal", ["ldn", "tgt,nyc|fed", NoInput(0)])
+def test_add_tenor_cached_invalid_tenor_raises(cal) -> None:
+    with pytest.raises(ValueError, match="`tenor` must identify frequency"):
+        add_tenor(dt(2023, 1, 2), "3x", "MF", cal)
+
+
+@pytest.mark.parametrize("cal", ["ldn", "tgt,nyc", "tgt|nyc"])
+def test_is_bus_days(cal) -> None:
+    cal_ = get_calendar(cal)
+    dates = [dt(2024, 12, 24), dt(2024, 12, 25), dt(2024, 12, 28), dt(2025, 1, 2)]
+    assert cal_.is_bus_days(dates) == [cal_.is_bus_day(_) for _ in dates]
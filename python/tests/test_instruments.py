@@ -276,6 +276,30 @@ class TestCurvesandSolver:
         )
         assert result == (curve, curve, curve, curve)
 
+    def test_get_curves_from_solver_str_ids_cached(self) -> None:
+        from rateslib.solver import Solver
+
+        curve = Curve({dt(2022, 1, 1): 1.0, dt(2023, 1, 1): 1.0}, id="tagged")
+        inst = [(Value(dt(2023, 1, 1)), ("tagged",), {})]
+        solver = Solver([curve], [], inst, [0.975])
+        args = (NoInput(0), solver, ["tagged", "tagged"], NoInput(0), NoInput(0), "")
+        result1, _, _ = _get_curves_fx_and_base_maybe_from_solver(*args)
+        result2, _, _ = _get_curves_fx_and_base_maybe_from_solver(*args)
+        assert result1 == result2 == (curve, curve, curve, curve)
+        assert solver._curves_cache == {("tagged", "tagged"): (curve, curve)}
+
+    def test_get_curves_from_solver_like_object_str_ids(self) -> None:
+        # objects other than a Solver need only provide pre_curves to resolve str ids
+        class SolverLike:
+            fx = NoInput(0)
+
+        curve = Curve({dt(2022, 1, 1): 1.0, dt(2023, 1, 1): 1.0}, id="tagged")
+        solver = SolverLike()
+        solver.pre_curves = {"tagged": curve}
+        args = (NoInput(0), solver, "tagged", NoInput(0), NoInput(0), "")
+        result, _, _ = _get_curves_fx_and_base_maybe_from_solver(*args)
+        assert result == (curve, curve, curve, curve)
+
     def test_get_proxy_curve_from_solver(self, usdusd, usdeur, eureur) -> None:
         # TODO: check whether curves in fxf but not is solver should be allowed???
         curve = Curve({dt(2022, 1, 1): 1.0, dt(2023, 1, 1): 1.0}, id="tagged")
@@ -799,6 +823,18 @@ class TestIRS:
         validate = irs.npv(curve)
         assert abs(validate) < 1e-8
 
+    def test_irs_spread_with_solver(self) -> None:
+        curve = Curve({dt(2022, 1, 1): 1.0, dt(2023, 1, 1): 0.96}, id="sofr")
+        solver = Solver(
+            curves=[curve],
+            instruments=[IRS(dt(2022, 1, 1), "1y", "A", curves="sofr")],
+            s=[4.0],
+        )
+        irs = IRS(dt(2022, 1, 1), "6m", "Q", fixed_rate=4.5, curves="sofr")
+        result = irs.spread(solver=solver)
+        expected = irs.spread(curves=curve)
+        assert abs(result - expected) < 1e-10
+
     @pytest.mark.parametrize(
         ("float_spread", "fixed_rate", "expected"),
         [
@@ -3043,6 +3079,16 @@ class TestFly:
         expected = np.array([[-0.02944899, 0.009254014565], [0.009254014565, 0.0094239781314]])
         assert np.all(np.isclose(result, expected))
 
+    def test_gamma_keeps_second_order_solver_state(self, simple_solver) -> None:
+        irs = IRS(dt(2022, 1, 1), "18m", "A", fixed_rate=1.0, notional=-1e6, curves="curve")
+        simple_solver._set_ad_order(2)
+        irs.gamma(solver=simple_solver)
+        cached = simple_solver._grad_s_s_vT
+        assert cached is not None
+        irs.gamma(solver=simple_solver)
+        assert simple_solver._ad == 2
+        assert simple_solver._grad_s_s_vT is cached
+
 
 class TestSpread:
     @pytest.mark.parametrize("mechanism", [False, True])
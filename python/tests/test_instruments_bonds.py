@@ -5,10 +5,11 @@ import pytest
 from pandas import DataFrame, Series, date_range
 from pandas.testing import assert_frame_equal
 from rateslib import defaults
+from rateslib.bonds import _horner, _ytm_discounted_sum
 from rateslib.calendars import dcf, get_calendar
 from rateslib.curves import Curve, IndexCurve, LineCurve
 from rateslib.default import NoInput
-from rateslib.dual import Dual, Dual2
+from rateslib.dual import Dual, Dual2, gradient
 from rateslib.fx import FXForwards, FXRates
 from rateslib.instruments import (
     IRS,
@@ -17,6 +18,7 @@ from rateslib.instruments import (
     FixedRateBond,
     FloatRateNote,
     IndexFixedRateBond,
+    _ytm_newton,
 )
 from rateslib.solver import Solver
 
@@ -105,6 +107,22 @@ class TestFixedRateBond:
         )
         assert ukg.ex_div(settlement) is exp
 
+    def test_ex_div_dates_follow_ex_div_days(self) -> None:
+        ukg = FixedRateBond(
+            effective=dt(1998, 1, 1),
+            termination=dt(2015, 12, 7),
+            frequency="S",
+            fixed_rate=8.0,
+            convention="ActActICMA",
+            calendar="ldn",
+            ex_div=7,
+            modifier="NONE",
+        )
+        assert ukg.ex_div(dt(1999, 5, 27)) is True
+        ukg.kwargs["ex_div"] = 1
+        assert ukg.ex_div(dt(1999, 5, 27)) is False
+        assert ukg.ex_div(dt(1999, 6, 7)) is True
+
     def test_fixed_rate_bond_price_ukg(self) -> None:
         # test pricing functions against Gilt Example prices from UK DMO
         bond = FixedRateBond(
@@ -750,6 +768,26 @@ class TestFixedRateBond:
         result = gilt.convexity(4.445, dt(1999, 5, 27))
         assert (result - numeric * 1000) < 1e-3
 
+    def test_fixed_rate_bond_metrics(self) -> None:
+        gilt = FixedRateBond(
+            effective=dt(1998, 12, 7),
+            termination=dt(2015, 12, 7),
+            frequency="S",
+            calendar="ldn",
+            currency="gbp",
+            convention="ActActICMA",
+            ex_div=7,
+            fixed_rate=8.0,
+        )
+        settle = dt(1999, 5, 27)
+        result = gilt.metrics(4.445, settle)
+        assert abs(result["clean_price"] - gilt.price(4.445, settle)) < 1e-10
+        assert abs(result["dirty_price"] - gilt.price(4.445, settle, dirty=True)) < 1e-10
+        assert abs(result["accrued"] - gilt.accrued(settle)) < 1e-10
+        for metric in ["risk", "modified", "duration"]:
+            assert abs(result[metric] - gilt.duration(4.445, settle, metric)) < 1e-10
+        assert abs(result["convexity"] - gilt.convexity(4.445, settle)) < 1e-10
+
     def test_fixed_rate_bond_rate(self) -> None:
         gilt = FixedRateBond(
             effective=dt(1998, 12, 7),
@@ -973,6 +1011,24 @@ class TestFixedRateBond:
         result = gilt.fwd_from_repo(100.0, s, f_s, 1.0, "act365f")
         assert abs(result - exp) < 1e-6
 
+    @pytest.mark.parametrize("dirty", [True, False])
+    def test_fwd_from_repo_same_settlement(self, dirty) -> None:
+        gilt = FixedRateBond(
+            effective=dt(1998, 12, 7),
+            termination=dt(2015, 12, 7),
+            frequency="S",
+            calendar="ldn",
+            currency="gbp",
+            convention="act365f",
+            ex_div=7,
+            fixed_rate=1.0,
+            notional=-100,
+            settle=0,
+        )
+        s = dt(2010, 11, 30)  # ex-div
+        result = gilt.fwd_from_repo(100.0, s, s, 5.0, "act365f", dirty=dirty)
+        assert result == 100.0
+
     @pytest.mark.parametrize(
         ("f_s", "f_p"),
         [
@@ -1481,6 +1537,19 @@ class TestBill:
         result = bill.simple_rate(99.93777777777778, dt(2004, 1, 22))
         assert abs(result - expected) < 1e-6
 
+    def test_bill_settlement_dcf_follows_settlement(self) -> None:
+        bill = Bill(
+            effective=dt(2004, 1, 22),
+            termination=dt(2004, 2, 19),
+            calendar="nyc",
+            currency="usd",
+            convention="Act360",
+            calc_mode="ustb",
+        )
+        assert abs(bill._settlement_dcf(dt(2004, 1, 22)) - 28 / 360) < 1e-14
+        assert abs(bill._settlement_dcf(dt(2004, 2, 5)) - 14 / 360) < 1e-14
+        assert abs(bill.price(0.8, dt(2004, 2, 5)) - (100 - 0.8 * 14 / 360)) < 1e-12
+
     def test_bill_rate(self) -> None:
         curve = Curve({dt(2004, 1, 22): 1.00, dt(2005, 1, 22): 0.992})
 
@@ -1772,6 +1841,11 @@ class TestFloatRateNote:
         result = bond.accrued(settlement)
         assert abs(result - expected) < 1e-8
 
+        # the dummy curve is reused by subsequent calls in the same period
+        curve = bond._ibor_dummy_curve_cache[1]
+        assert abs(bond.accrued(settlement) - expected) < 1e-8
+        assert bond._ibor_dummy_curve_cache[1] is curve
+
     def test_float_rate_bond_raise_frequency(self) -> None:
         with pytest.raises(ValueError, match="FloatRateNote `frequency`"):
             FloatRateNote(
@@ -1864,6 +1938,25 @@ class TestFloatRateNote:
         result = bond.accrued(dt(2010, 3, 16))
         assert result == 0.0
 
+    def test_accrued_period_cache_follows_inputs(self) -> None:
+        bond = FloatRateNote(
+            effective=dt(2010, 3, 16),
+            termination=dt(2017, 3, 16),
+            frequency="Q",
+            convention="Act365f",
+            ex_div=0,
+            float_spread=0,
+            fixing_method="rfr_observation_shift",
+            method_param=0,
+            spread_compound_method="none_simple",
+            calendar=NoInput(0),
+        )
+        p1 = bond._accrued_period(dt(2010, 4, 1), 0)
+        assert bond._accrued_period(dt(2010, 4, 1), 0) is p1
+        assert bond._accrued_period(dt(2010, 4, 2), 0).end == dt(2010, 4, 2)
+        bond.float_spread = 10.0
+        assert bond._accrued_period(dt(2010, 4, 2), 0).float_spread == 10.0
+
     def test_float_rate_bond_analytic_delta(self) -> None:
         frn = FloatRateNote(
             effective=dt(2010, 6, 7),
@@ -2447,3 +2540,73 @@ class TestBondFuture:
         result = future.duration(112.98, delivery=delivery, metric="modified")[0]
         expected = 7.23419455163
         assert abs(result - expected) < 1e-3
+
+
+@pytest.mark.parametrize("regular", [True, False])
+@pytest.mark.parametrize("ex_div", [True, False])
+@pytest.mark.parametrize("n", [1, 2, 3, 6])
+def test_ytm_discounted_sum(n, ex_div, regular) -> None:
+    # regular bonds have equal intermediate coupons which are summed in closed form
+    cashflows = [1.0 + (0.0 if regular and 0 < i < n - 1 else 0.1 * i) for i in range(n)]
+    v1, v2, v3 = Dual(0.99, ["y"], []), Dual(0.98, ["y"], [2.0]), Dual(0.97, ["y"], [3.0])
+    factors = [v1 * v2**i for i in range(n - 1)]
+    factors.append(v1 if n == 1 else v1 * v2 ** (n - 2) * v3)
+    expected = sum(c * v for c, v in zip(cashflows, factors)) + 100.0 * factors[-1]
+    if ex_div:
+        expected -= cashflows[0] * factors[0]
+    result = _ytm_discounted_sum(cashflows, 100.0, v1, v2, v3, ex_div)
+    assert abs(float(result) - float(expected)) < 1e-12
+    assert abs(gradient(result, ["y"])[0] - gradient(expected, ["y"])[0]) < 1e-10
+
+
+@pytest.mark.parametrize("y", [1e-6, 1e-5, 5e-4, 2e-3])
+def test_ytm_discounted_sum_near_zero_yield(y) -> None:
+    # the closed form geometric sum cancels badly as v2 approaches 1
+    cashflows = [1.5] * 40
+    v1, v2, v3 = Dual(0.999, ["y"], []), Dual(1 / (1 + y), ["y"], [-1.0]), Dual(0.999, ["y"], [])
+    expected = (cashflows[-1] + 100.0) * v3
+    for cashflow in reversed(cashflows[1:-1]):
+        expected = (expected + cashflow) * v2
+    expected = (expected + cashflows[0]) * v1
+    result = _ytm_discounted_sum(cashflows, 100.0, v1, v2, v3, False)
+    assert abs(float(result) / float(expected) - 1.0) < 1e-14
+    assert abs(gradient(result, ["y"])[0] / gradient(expected, ["y"])[0] - 1.0) < 1e-12
+
+
+@pytest.mark.parametrize("dual_type", [Dual, Dual2])
+def test_horner_single_variable(dual_type) -> None:
+    cashflows = [1.0, 1.5, 2.0, 0.5]
+    if dual_type is Dual:
+        d, v = Dual(3.0, ["y"], [0.5]), Dual(0.98, ["y"], [2.0])
+    else:
+        d, v = Dual2(3.0, ["y"], [0.5], [0.1]), Dual2(0.98, ["y"], [2.0], [0.3])
+    expected = d
+    for cashflow in reversed(cashflows):
+        expected = (expected + cashflow) * v
+    result = _horner(d, cashflows, v)
+    assert type(result) is dual_type
+    assert abs(result - expected) < 1e-12
+    assert all(np.isclose(result.dual, expected.dual))
+    if dual_type is Dual2:
+        assert all(np.isclose(result.dual2, expected.dual2).flat)
+
+
+def test_ytm_newton() -> None:
+    result = _ytm_newton(lambda y: (100.0 / (1 + y / 100) - 95.0, -1.0 / (1 + y / 100) ** 2), 1.0)
+    assert abs(result - 500.0 / 95.0) < 1e-8
+
+    # a flat function cannot be solved and returns None for a bracketing fallback
+    assert _ytm_newton(lambda y: (1.0, 0.0), 1.0) is None
+
+    # a diverging iteration, here oscillating with growing steps, also returns None
+    assert _ytm_newton(lambda y: (np.cbrt(y), 1 / (3 * np.cbrt(y) ** 2)), 1.0) is None
+
+
+def test_period_cashflows_cache_follows_fixed_rate() -> None:
+    bond = FixedRateBond(dt(2000, 1, 1), "10y", spec="ukt", fixed_rate=2.0)
+    p1 = bond.price(4.0, dt(2001, 3, 1))
+    bond.fixed_rate = 3.0
+    p2 = bond.price(4.0, dt(2001, 3, 1))
+    expected = FixedRateBond(dt(2000, 1, 1), "10y", spec="ukt", fixed_rate=3.0)
+    assert abs(p2 - expected.price(4.0, dt(2001, 3, 1))) < 1e-12
+    assert p2 > p1
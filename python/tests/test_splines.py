@@ -4,7 +4,15 @@ import numpy as np
 import pytest
 from rateslib.dual import Dual, Dual2, gradient, set_order_convert
 from rateslib.json import from_json
-from rateslib.splines import PPSplineDual, PPSplineDual2, PPSplineF64
+from rateslib.splines import (
+    PPSplineDual,
+    PPSplineDual2,
+    PPSplineF64,
+    evaluate,
+    evaluate_dot,
+    evaluate_into,
+    evaluate_many,
+)
 
 
 @pytest.fixture
@@ -119,6 +127,80 @@ def test_ppev(t) -> None:
     assert (result == np.array([r1, r2, r3])).all()
 
 
+@pytest.mark.parametrize("x", [2, np.float64(2.0), np.int64(2), np.array(2.0)])
+def test_evaluate_numeric_types(t, x) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    assert evaluate(bs, x, 1) == evaluate(bs, 2.0, 1)
+
+
+@pytest.mark.parametrize("m", [0, 1, 2])
+def test_evaluate_many(t, m) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    x = [1.1, 1.8, 2.8, 4.0]
+    expected = [evaluate(bs, _, m) for _ in x]
+    assert evaluate_many(bs, x, m) == expected
+    assert evaluate_many(bs, np.array(x), m) == expected
+
+
+def test_evaluate_ndarray(t) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    x = np.array([1.1, 1.8, 2.8, 4.0])
+    result = evaluate(bs, x, 1)
+    assert isinstance(result, np.ndarray)
+    assert (result == np.array([evaluate(bs, _, 1) for _ in x])).all()
+
+
+@pytest.mark.parametrize("m", [0, 1, 2, 4])
+def test_evaluate_float32(t, m) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    x = np.array([1.1, 1.8, 2.8, 4.0], dtype=np.float32)
+    result = evaluate(bs, x, m)
+    assert result.dtype == np.float32
+    expected = bs.ppdnev(x.astype(np.float64), m)
+    assert np.all(np.abs(result - expected) < 1e-5)
+
+
+@pytest.mark.parametrize("x", [1.1, Dual(1.8, ["x"], [2.0]), Dual2(2.8, ["y"], [1.0], [])])
+@pytest.mark.parametrize("m", [0, 1])
+def test_evaluate_dot(t, x, m) -> None:
+    c = [1, 2, -1, 2, 1, 1, 2, 2.0]
+    bs = PPSplineF64(k=4, t=t, c=c)
+    result = evaluate_dot(PPSplineF64(k=4, t=t), x, c, m)
+    expected = evaluate(bs, x, m)
+    assert abs(float(result) - float(expected)) < 1e-12
+    if not isinstance(x, float):
+        assert np.all(np.abs(gradient(result, x.vars) - gradient(expected, x.vars)) < 1e-12)
+
+
+def test_evaluate_many_dual(t) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    x = [1.1, Dual(1.8, ["x"], []), Dual(2.8, ["y"], [])]
+    result = evaluate_many(bs, x, 1)
+    assert result[0] == evaluate(bs, 1.1, 1)
+    assert result[1] == evaluate(bs, Dual(1.8, ["x"], []), 1)
+    assert result[2] == evaluate(bs, Dual(2.8, ["y"], []), 1)
+
+
+@pytest.mark.parametrize("m", [0, 1])
+def test_evaluate_into(t, m) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    x = np.array([1.1, 1.8, 2.8])
+    x_grad = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 1.0]])
+    out = np.zeros(3)
+    out_grad = np.zeros((3, 2))
+    evaluate_into(bs, x, x_grad, out, out_grad, m)
+    for i in range(3):
+        expected = evaluate(bs, Dual(x[i], ["a", "b"], x_grad[i, :].tolist()), m)
+        assert abs(out[i] - expected.real) < 1e-12
+        assert np.all(np.abs(out_grad[i, :] - gradient(expected, ["a", "b"])) < 1e-12)
+
+
+def test_evaluate_into_shape_raises(t) -> None:
+    bs = PPSplineF64(k=4, t=t, c=[1, 2, -1, 2, 1, 1, 2, 2.0])
+    with pytest.raises(ValueError, match="`x_grad` and `out_grad` must have shape"):
+        evaluate_into(bs, np.zeros(3), np.zeros((3, 2)), np.zeros(3), np.zeros((2, 2)))
+
+
 def test_csolve() -> None:
     t = [0, 0, 0, 0, 4, 4, 4, 4]
     tau = np.array([0, 1, 3, 4])
@@ -28,12 +28,29 @@ pub enum CalType {
 ///
 #[pyclass(module = "rateslib.rs")]
 #[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+#[serde(from = "CalDataModel")]
 pub struct Cal {
     pub(crate) holidays: IndexSet<NaiveDateTime>,
     pub(crate) week_mask: HashSet<Weekday>,
+    /// The `week_mask` with one bit per excluded day (bit 0=Mon,.., bit 6=Sun), used for
+    /// date checks.
+    #[serde(skip)]
+    pub(crate) week_mask_bits: u8,
     // pub(crate) meta: Vec<String>,
 }
 
+#[derive(Deserialize)]
+struct CalDataModel {
+    holidays: IndexSet<NaiveDateTime>,
+    week_mask: HashSet<Weekday>,
+}
+
+impl std::convert::From<CalDataModel> for Cal {
+    fn from(model: CalDataModel) -> Self {
+        Self::from_sets(model.holidays, model.week_mask)
+    }
+}
+
 impl Cal {
     /// Create a calendar.
     ///
@@ -44,12 +61,25 @@ impl Cal {
         week_mask: Vec<u8>,
         // rules: Vec<&str>
     ) -> Self {
-        Cal {
-            holidays: IndexSet::from_iter(holidays),
-            week_mask: HashSet::from_iter(
-                week_mask.into_iter().map(|v| Weekday::try_from(v).unwrap()),
-            ),
+        Cal::from_sets(
+            IndexSet::from_iter(holidays),
+            HashSet::from_iter(week_mask.into_iter().map(|v| Weekday::try_from(v).unwrap())),
             // meta: rules.into_iter().map(|x| x.to_string()).collect(),
+        )
+    }
+
+    /// Create a calendar from its sets of holidays and excluded weekdays.
+    pub(crate) fn from_sets(
+        holidays: IndexSet<NaiveDateTime>,
+        week_mask: HashSet<Weekday>,
+    ) -> Self {
+        let week_mask_bits = week_mask
+            .iter()
+            .fold(0_u8, |bits, day| bits | (1 << day.num_days_from_monday()));
+        Cal {
+            holidays,
+            week_mask,
+            week_mask_bits,
         }
     }
 }
@@ -81,6 +111,29 @@ impl UnionCal {
             settlement_calendars,
         }
     }
+
+    /// Return an equivalent `UnionCal` whose calendars, and settlement calendars, are each
+    /// combined into a single `Cal`.
+    ///
+    /// A date is a business day of the union only if it is a business day of every calendar, so
+    /// the combined `Cal` has the union of the holidays and the week masks. Checking a date then
+    /// requires a single holiday lookup rather than one per calendar.
+    pub(crate) fn merged(&self) -> UnionCal {
+        fn merge(cals: &[Cal]) -> Cal {
+            Cal::from_sets(
+                cals.iter()
+                    .flat_map(|c| c.holidays.iter().cloned())
+                    .collect(),
+                cals.iter()
+                    .flat_map(|c| c.week_mask.iter().cloned())
+                    .collect(),
+            )
+        }
+        UnionCal {
+            calendars: vec![merge(&self.calendars)],
+            settlement_calendars: self.settlement_calendars.as_ref().map(|v| vec![merge(v)]),
+        }
+    }
 }
 
 /// A wrapper for a UnionCal struct specified by a string representation.
@@ -94,6 +147,10 @@ pub struct NamedCal {
     pub(crate) name: String,
     #[serde(skip)]
     pub(crate) union_cal: UnionCal,
+    /// The `union_cal` with its calendars, and its settlement calendars, each combined into
+    /// a single `Cal`, used for date checks.
+    #[serde(skip)]
+    pub(crate) merged_cal: UnionCal,
 }
 
 #[derive(Deserialize)]
@@ -120,24 +177,18 @@ impl NamedCal {
             Err(PyValueError::new_err(
                 "Cannot use more than one pipe ('|') operator in `name`.",
             ))
-        } else if parts.len() == 1 {
-            let cals: Vec<Cal> = parse_cals(parts[0])?;
-            Ok(Self {
-                name: name_,
-                union_cal: UnionCal {
-                    calendars: cals,
-                    settlement_calendars: None,
-                },
-            })
         } else {
-            let cals: Vec<Cal> = parse_cals(parts[0])?;
-            let settle_cals: Vec<Cal> = parse_cals(parts[1])?;
+            let union_cal = UnionCal {
+                calendars: parse_cals(parts[0])?,
+                settlement_calendars: match parts.get(1) {
+                    Some(part) => Some(parse_cals(part)?),
+                    None => None,
+                },
+            };
             Ok(Self {
                 name: name_,
-                union_cal: UnionCal {
-                    calendars: cals,
-                    settlement_calendars: Some(settle_cals),
-                },
+                merged_cal: union_cal.merged(),
+                union_cal,
             })
         }
     }
@@ -153,7 +204,7 @@ fn parse_cals(name: &str) -> Result<Vec<Cal>, PyErr> {
 
 impl DateRoll for Cal {
     fn is_weekday(&self, date: &NaiveDateTime) -> bool {
-        !self.week_mask.contains(&date.weekday())
+        self.week_mask_bits & (1 << date.weekday().num_days_from_monday()) == 0
     }
 
     fn is_holiday(&self, date: &NaiveDateTime) -> bool {
@@ -183,15 +234,15 @@ impl DateRoll for UnionCal {
 
 impl DateRoll for NamedCal {
     fn is_weekday(&self, date: &NaiveDateTime) -> bool {
-        self.union_cal.is_weekday(date)
+        self.merged_cal.is_weekday(date)
     }
 
     fn is_holiday(&self, date: &NaiveDateTime) -> bool {
-        self.union_cal.is_holiday(date)
+        self.merged_cal.is_holiday(date)
     }
 
     fn is_settlement(&self, date: &NaiveDateTime) -> bool {
-        self.union_cal.is_settlement(date)
+        self.merged_cal.is_settlement(date)
     }
 }
 
@@ -343,6 +394,26 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_union_cal_merged() {
+        let ncal = NamedCal::try_new("tgt,ldn|nyc,stk").unwrap();
+        assert_eq!(ncal.union_cal.calendars.len(), 2);
+        assert_eq!(ncal.merged_cal.calendars.len(), 1);
+        let dates = ncal
+            .cal_date_range(&ndt(2020, 1, 1), &ndt(2025, 12, 31))
+            .unwrap();
+        for date in dates.iter() {
+            assert_eq!(
+                ncal.union_cal.is_bus_day(date),
+                ncal.merged_cal.is_bus_day(date)
+            );
+            assert_eq!(
+                ncal.union_cal.is_settlement(date),
+                ncal.merged_cal.is_settlement(date)
+            );
+        }
+    }
+
     #[test]
     fn test_union_cal_with_settle() {
         let hols = vec![
@@ -439,4 +510,19 @@ mod tests {
         assert_ne!(cal2, ucal);
         assert_ne!(ucal, cal2);
     }
+
+    #[test]
+    fn test_week_mask_bits() {
+        let cal = fixture_hol_cal();
+        assert_eq!(cal.week_mask_bits, 0b110_0000);
+        assert!(cal.is_weekday(&ndt(2015, 9, 4)));
+        assert!(!cal.is_weekday(&ndt(2015, 9, 6)));
+
+        // the bits are not serialized but are restored when deserializing
+        let json = serde_json::to_string(&cal).unwrap();
+        assert!(!json.contains("week_mask_bits"));
+        let cal2: Cal = serde_json::from_str(&json).unwrap();
+        assert_eq!(cal2.week_mask_bits, 0b110_0000);
+        assert_eq!(cal, cal2);
+    }
 }
@@ -184,6 +184,24 @@ impl Cal {
         self.is_non_bus_day(&date)
     }
 
+    /// Return whether each of the `dates` is a business day.
+    ///
+    /// This is equivalent to calling :meth:`~rateslib.calendars.Cal.is_bus_day` for each
+    /// date, but crosses into the compiled calendar only once.
+    ///
+    /// Parameters
+    /// ----------
+    /// dates: list[datetime]
+    ///     Dates to test
+    ///
+    /// Returns
+    /// -------
+    /// list[bool]
+    #[pyo3(name = "is_bus_days")]
+    fn is_bus_days_py(&self, dates: Vec<NaiveDateTime>) -> Vec<bool> {
+        self.is_bus_days(&dates)
+    }
+
     /// Return whether the `date` is a business day of an associated settlement calendar.
     ///
     /// .. note::
@@ -493,6 +511,14 @@ impl UnionCal {
         self.is_non_bus_day(&date)
     }
 
+    /// Return whether each of the `dates` is a business day.
+    ///
+    /// See :meth:`Cal.is_bus_days <rateslib.calendars.Cal.is_bus_days>`.
+    #[pyo3(name = "is_bus_days")]
+    fn is_bus_days_py(&self, dates: Vec<NaiveDateTime>) -> Vec<bool> {
+        self.is_bus_days(&dates)
+    }
+
     /// Return whether the `date` is a business day in an associated settlement calendar.
     ///
     /// If no such associated settlement calendar exists this will return *True*.
@@ -671,6 +697,14 @@ impl NamedCal {
         self.is_non_bus_day(&date)
     }
 
+    /// Return whether each of the `dates` is a business day.
+    ///
+    /// See :meth:`Cal.is_bus_days <rateslib.calendars.Cal.is_bus_days>`.
+    #[pyo3(name = "is_bus_days")]
+    fn is_bus_days_py(&self, dates: Vec<NaiveDateTime>) -> Vec<bool> {
+        self.is_bus_days(&dates)
+    }
+
     /// Return whether the `date` is a business day in an associated settlement calendar.
     ///
     /// If no such associated settlement calendar exists this will return *True*.
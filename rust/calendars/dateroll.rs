@@ -62,6 +62,11 @@ pub trait DateRoll {
         !self.is_bus_day(date)
     }
 
+    /// Returns whether each of the dates is a business day.
+    fn is_bus_days(&self, dates: &[NaiveDateTime]) -> Vec<bool> {
+        dates.iter().map(|d| self.is_bus_day(d)).collect()
+    }
+
     /// Return the `date`, if a business day, or get the next business date after `date`.
     fn roll_forward_bus_day(&self, date: &NaiveDateTime) -> NaiveDateTime {
         let mut new_date = *date;
@@ -268,26 +273,13 @@ pub trait DateRoll {
             _ => *roll,
         };
 
-        // convert months to a set of years and remainder months
-        let mut yr_roll = (months.abs() / 12) * months.signum();
-        let rem_months = months - yr_roll * 12;
-
-        // determine the new month
-        let mut new_month = i32::try_from(date.month()).unwrap() + rem_months;
-        if new_month <= 0 {
-            yr_roll -= 1;
-            new_month = new_month.rem_euclid(12);
-        } else if new_month >= 13 {
-            yr_roll += 1;
-            new_month = new_month.rem_euclid(12);
-        }
-        if new_month == 0 {
-            new_month = 12;
-        }
+        // determine the new year and month from the zero based month count
+        let total_months = date.month0() as i32 + months;
+        let yr_roll = total_months.div_euclid(12);
+        let new_month = total_months.rem_euclid(12) as u32 + 1;
 
         // perform the date roll
-        let new_date =
-            get_roll(date.year() + yr_roll, new_month.try_into().unwrap(), &roll_).unwrap();
+        let new_date = get_roll(date.year() + yr_roll, new_month, &roll_).unwrap();
         self.roll(&new_date, modifier, settlement)
     }
 
@@ -364,9 +356,11 @@ pub fn get_imm(year: i32, month: u32) -> NaiveDateTime {
     }
 }
 
-fn roll_with_settlement(
+// These are generic rather than taking `&dyn DateRoll` so that the rolling loops are
+// monomorphised for each calendar type, with static, inlinable, business day checks.
+fn roll_with_settlement<T: DateRoll + ?Sized>(
     date: &NaiveDateTime,
-    cal: &dyn DateRoll,
+    cal: &T,
     modifier: &Modifier,
 ) -> NaiveDateTime {
     match modifier {
@@ -378,9 +372,9 @@ fn roll_with_settlement(
     }
 }
 
-fn roll_without_settlement(
+fn roll_without_settlement<T: DateRoll + ?Sized>(
     date: &NaiveDateTime,
-    cal: &dyn DateRoll,
+    cal: &T,
     modifier: &Modifier,
 ) -> NaiveDateTime {
     match modifier {
@@ -518,6 +512,14 @@ mod tests {
         assert!(cal.is_non_bus_day(&saturday)); // Saturday
     }
 
+    #[test]
+    fn test_is_business_days() {
+        let cal = fixture_hol_cal();
+        let dates = vec![ndt(2015, 9, 7), ndt(2015, 9, 10), ndt(2024, 1, 6)];
+        assert_eq!(cal.is_bus_days(&dates), vec![false, true, false]);
+        assert_eq!(cal.is_bus_days(&[]), Vec::<bool>::new());
+    }
+
     #[test]
     fn test_lag() {
         let cal = fixture_hol_cal();
@@ -718,6 +720,28 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_add_months_year_boundaries() {
+        let cal = get_calendar_by_name("all").unwrap();
+        let roll = RollDay::Int { day: 15 };
+        let cases = vec![
+            (ndt(2000, 1, 15), -1, ndt(1999, 12, 15)),
+            (ndt(2000, 1, 15), -12, ndt(1999, 1, 15)),
+            (ndt(2000, 1, 15), -13, ndt(1998, 12, 15)),
+            (ndt(2000, 12, 15), 1, ndt(2001, 1, 15)),
+            (ndt(2000, 12, 15), 12, ndt(2001, 12, 15)),
+            (ndt(2000, 6, 15), 30, ndt(2002, 12, 15)),
+            (ndt(2000, 6, 15), -30, ndt(1997, 12, 15)),
+            (ndt(2000, 6, 15), 0, ndt(2000, 6, 15)),
+        ];
+        for (start, months, expected) in cases {
+            assert_eq!(
+                cal.add_months(&start, months, &Modifier::Act, &roll, false),
+                expected
+            );
+        }
+    }
+
     #[test]
     fn test_add_months_modifier() {
         let cal = get_calendar_by_name("bus").unwrap();
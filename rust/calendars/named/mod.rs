@@ -20,6 +20,12 @@ use chrono::NaiveDateTime;
 use pyo3::exceptions::PyValueError;
 use pyo3::PyErr;
 use std::collections::HashMap;
+use std::sync::OnceLock;
+
+/// The names of the pre-existing calendars.
+const NAMES: &[&str] = &[
+    "all", "bus", "nyc", "fed", "tgt", "ldn", "stk", "osl", "zur", "tro", "tyo", "syd", "wlg",
+];
 
 fn get_weekmask_by_name(name: &str) -> Result<Vec<u8>, PyErr> {
     let hmap: HashMap<&str, &[u8]> = HashMap::from([
@@ -107,11 +113,30 @@ fn get_holidays_by_name(name: &str) -> Result<Vec<NaiveDateTime>, PyErr> {
 /// let ldn_cal = get_calendar_by_name("ldn").unwrap();
 /// ```
 pub fn get_calendar_by_name(name: &str) -> Result<Cal, PyErr> {
-    Ok(Cal::new(
-        get_holidays_by_name(name)?,
-        get_weekmask_by_name(name)?,
-        // get_rules_by_name(name)?
-    ))
+    match named_calendars().get(name) {
+        None => Err(PyValueError::new_err(format!(
+            "'{}' is not found in list of existing calendars.",
+            name
+        ))),
+        Some(cal) => Ok(cal
+            .get_or_init(|| {
+                Cal::new(
+                    get_holidays_by_name(name).unwrap(),
+                    get_weekmask_by_name(name).unwrap(),
+                    // get_rules_by_name(name).unwrap()
+                )
+            })
+            .clone()),
+    }
+}
+
+/// Return the process wide store of each named `Cal`.
+///
+/// Parsing the static holiday data of a calendar is far more expensive than cloning the parsed
+/// `Cal`, so each is parsed once, on first request, and cloned thereafter.
+fn named_calendars() -> &'static HashMap<&'static str, OnceLock<Cal>> {
+    static CALENDARS: OnceLock<HashMap<&'static str, OnceLock<Cal>>> = OnceLock::new();
+    CALENDARS.get_or_init(|| NAMES.iter().map(|name| (*name, OnceLock::new())).collect())
 }
 
 // UNIT TESTS
@@ -145,6 +170,25 @@ mod tests {
         assert_eq!(result, expected);
     }
 
+    #[test]
+    fn test_get_cal_repeated() {
+        let first = get_calendar_by_name("ldn").unwrap();
+        let second = get_calendar_by_name("ldn").unwrap();
+        assert_eq!(first, second);
+        assert_eq!(
+            first.holidays.len(),
+            get_holidays_by_name("ldn").unwrap().len()
+        );
+    }
+
+    #[test]
+    fn test_names() {
+        for name in NAMES {
+            assert!(get_weekmask_by_name(name).is_ok());
+            assert!(get_holidays_by_name(name).is_ok());
+        }
+    }
+
     #[test]
     fn test_all() {
         let cal = get_calendar_by_name("all").unwrap();
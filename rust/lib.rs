@@ -23,7 +23,8 @@ use dual::{ADOrder, Dual, Dual2};
 
 pub mod splines;
 use splines::spline_py::{
-    bspldnev_single, bsplev_single, PPSplineDual, PPSplineDual2, PPSplineF64,
+    bspldnev_single, bsplev_single, evaluate, ppdnev_dual_into, ppdnev_f32, PPSplineDual,
+    PPSplineDual2, PPSplineF64,
 };
 
 pub mod curves;
@@ -64,6 +65,9 @@ fn rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PPSplineDual2>()?;
     m.add_function(wrap_pyfunction!(bsplev_single, m)?)?;
     m.add_function(wrap_pyfunction!(bspldnev_single, m)?)?;
+    m.add_function(wrap_pyfunction!(evaluate, m)?)?;
+    m.add_function(wrap_pyfunction!(ppdnev_dual_into, m)?)?;
+    m.add_function(wrap_pyfunction!(ppdnev_f32, m)?)?;
 
     // Curves
     m.add_class::<Curve>()?;
@@ -1,6 +1,6 @@
-use crate::dual::linalg::{dmul11_, fdmul11_, fdsolve, fouter11_};
+use crate::dual::linalg::{fdsolve, fouter11_};
 use crate::dual::{Dual, Dual2, Gradient1, Gradient2, Number, NumberMapping};
-use ndarray::{Array1, Array2};
+use ndarray::{Array1, Array2, ArrayView1, ArrayView2, ArrayViewMut1, ArrayViewMut2, Zip};
 use num_traits::{Signed, Zero};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::PyErr;
@@ -8,7 +8,8 @@ use serde::{Deserialize, Serialize};
 use std::{
     cmp::PartialEq,
     iter::{zip, Sum},
-    ops::{Mul, Sub},
+    ops::{Mul, Range, Sub},
+    sync::OnceLock,
 };
 
 /// Evaluate the `x` value on the `i`'th B-spline with order `k` and knot sequence `t`.
@@ -167,6 +168,62 @@ pub fn bspldnev_single_dual2(
     Dual2::clone_from(x, b_f64, dbdx_f64 * x.dual(), dual2)
 }
 
+/// Return the number of leading elements of `t` for which `pred` is true, where `pred` is
+/// true for a prefix of `t` and false thereafter, i.e. equivalent to `t.partition_point(pred)`.
+///
+/// The binary search halves the range without data-dependent branching, so that knot span
+/// lookups for unordered `x` values do not incur branch mispredictions.
+#[inline(always)]
+fn partition_point_branchless<F: Fn(&f64) -> bool>(t: &[f64], pred: F) -> usize {
+    let mut base: usize = 0;
+    let mut size: usize = t.len();
+    while size > 1 {
+        let half = size / 2;
+        let mid = base + half;
+        base = if pred(&t[mid]) { mid } else { base };
+        size -= half;
+    }
+    base + (size == 1 && pred(&t[base])) as usize
+}
+
+/// Evaluate, at `u`, the polynomial with coefficients `a` in the power basis, i.e.
+/// `a_0 + a_1 u + a_2 u^2 + ...`, using Horner's method.
+fn horner<T>(a: &[T], u: &f64) -> T
+where
+    T: Clone + Zero,
+    for<'a> &'a f64: Mul<&'a T, Output = T>,
+{
+    a.iter().rev().fold(T::zero(), |y, c| c.clone() + u * &y)
+}
+
+/// Return the power basis coefficients of the `m`'th order derivative of the polynomial with
+/// power basis coefficients `a`.
+fn power_derivative<T>(a: &[T], m: usize) -> Vec<T>
+where
+    for<'a> &'a f64: Mul<&'a T, Output = T>,
+{
+    (m..a.len())
+        .map(|j| {
+            // falling factorial: j! / (j - m)!
+            let scale: f64 = ((j + 1 - m)..=j).map(|v| v as f64).product();
+            &scale * &a[j]
+        })
+        .collect()
+}
+
+/// Evaluate, at `u`, the cubic polynomial with coefficients `a` in the power basis, with the
+/// Horner recurrence fully unrolled.
+#[inline]
+fn horner_cubic<T>(a: &[T], u: &f64) -> T
+where
+    T: Clone + Zero,
+    for<'a> &'a f64: Mul<&'a T, Output = T>,
+{
+    let y: T = a[2].clone() + u * &a[3];
+    let y: T = a[1].clone() + u * &y;
+    a[0].clone() + u * &y
+}
+
 /// A piecewise polynomial spline of given order and knot sequence.
 #[derive(Clone, Debug, Deserialize, Serialize)]
 pub struct PPSpline<T> {
@@ -174,6 +231,8 @@ pub struct PPSpline<T> {
     t: Vec<f64>,
     c: Option<Array1<T>>,
     n: usize,
+    #[serde(skip)]
+    power: OnceLock<Vec<T>>,
 }
 
 impl<T> PPSpline<T> {
@@ -207,17 +266,173 @@ where
         assert!(zip(&t[1..], &t[..(t.len() - 1)]).all(|(a, b)| a >= b));
         let n = t.len() - k;
         let c_ = c.map(Array1::from_vec);
-        PPSpline { k, t, n, c: c_ }
+        PPSpline {
+            k,
+            t,
+            n,
+            c: c_,
+            power: OnceLock::new(),
+        }
+    }
+
+    /// Return the range of b-spline indices whose support, `[t_i, t_{i+k}]`, contains `x`.
+    ///
+    /// Every b-spline, and each of its derivatives, outside of this range evaluates to zero
+    /// at `x`, so only these need to be calculated.
+    pub fn support(&self, x: &f64) -> Range<usize> {
+        let lower = partition_point_branchless(&self.t, |v| v < x).saturating_sub(self.k);
+        let upper = partition_point_branchless(&self.t, |v| v <= x).min(self.n);
+        lower..upper.max(lower)
+    }
+
+    /// Return the index, `mu`, of the knot span `t_mu <= x < t_{mu+1}` containing `x`, or
+    /// `None` if `x` lies outside of the spline domain, `[t_{k-1}, t_n]`.
+    ///
+    /// The right endpoint, `x = t_n`, is contained in the last span only if it is also the last
+    /// knot, consistent with the right endpoint support of the b-splines.
+    fn span(&self, x: &f64) -> Option<usize> {
+        let (k, n, t) = (self.k, self.n, &self.t);
+        if n == 0 || *x < t[k - 1] || *x > t[n] {
+            None
+        } else if *x == t[n] {
+            if *x != t[t.len() - 1] || t[n - 1] == t[n] {
+                None
+            } else {
+                Some(n - 1)
+            }
+        } else {
+            Some(partition_point_branchless(t, |v| v <= x) - 1)
+        }
+    }
+
+    /// Return the index of the first non-zero b-spline at `x` and the values of the `m`'th
+    /// order derivative of each of the non-zero b-splines.
+    ///
+    /// Within the spline domain the values are calculated with de Boor's triangle over the
+    /// knots local to `x`, instead of recursively evaluating each b-spline separately.
+    pub fn basis_row(&self, x: &f64, m: usize) -> (usize, Vec<f64>) {
+        let (k, t) = (self.k, &self.t);
+        let mu = match self.span(x) {
+            Some(mu) => mu,
+            None => {
+                let support = self.support(x);
+                return (
+                    support.start,
+                    support
+                        .map(|i| bspldnev_single_f64(x, i, &self.k, &self.t, m, None))
+                        .collect(),
+                );
+            }
+        };
+        let mut b: Vec<f64> = vec![0.0_f64; k];
+        if m >= k {
+            return (mu + 1 - k, b);
+        }
+
+        // values of the non-zero b-splines of order (k - m)
+        let mut left: Vec<f64> = vec![0.0_f64; k];
+        let mut right: Vec<f64> = vec![0.0_f64; k];
+        b[0] = 1.0_f64;
+        for j in 1..(k - m) {
+            left[j] = x - t[mu + 1 - j];
+            right[j] = t[mu + j] - x;
+            let mut saved = 0.0_f64;
+            for r in 0..j {
+                let temp = b[r] / (right[r + 1] + left[j - r]);
+                b[r] = saved + right[r + 1] * temp;
+                saved = left[j - r] * temp;
+            }
+            b[j] = saved;
+        }
+
+        // raise the order by differentiation until the order k b-splines are reached
+        for q in (k - m + 1)..=k {
+            for j in (0..q).rev() {
+                let i = mu + 1 + j - q;
+                let mut v = 0.0_f64;
+                if j >= 1 {
+                    let div1 = t[i + q - 1] - t[i];
+                    if div1 != 0.0_f64 {
+                        v += b[j - 1] / div1;
+                    }
+                }
+                if j + 2 <= q {
+                    let div2 = t[i + q] - t[i + 1];
+                    if div2 != 0.0_f64 {
+                        v -= b[j] / div2;
+                    }
+                }
+                b[j] = (q - 1) as f64 * v;
+            }
+        }
+        (mu + 1 - k, b)
+    }
+
+    /// Return the coefficients of the polynomial on each knot span, `t_mu <= x < t_{mu+1}`, in
+    /// the power basis of `u = x - t_mu`, i.e. the Taylor expansion of the spline about `t_mu`,
+    /// together with those of each of its derivatives, indexed by order `m < k`.
+    ///
+    /// The coefficients are stored in a single contiguous array with a fixed stride of `k` per
+    /// derivative order and `k * k` per span, see [PPSpline::power_coefficients], so that
+    /// evaluation requires no pointer chasing. Spans of zero width are never evaluated and are
+    /// zero.
+    fn power_basis(&self, c: &Array1<T>) -> Vec<T> {
+        let k = self.k;
+        let mut power: Vec<T> = Vec::with_capacity((self.n + 1).saturating_sub(k) * k * k);
+        for mu in (k - 1)..self.n {
+            if self.t[mu] == self.t[mu + 1] {
+                power.extend((0..k * k).map(|_| T::zero()));
+                continue;
+            }
+            let mut factorial = 1.0_f64;
+            let a: Vec<T> = (0..k)
+                .map(|j| {
+                    factorial *= j.max(1) as f64;
+                    let (start, row) = self.basis_row(&self.t[mu], j);
+                    row.iter()
+                        .enumerate()
+                        .map(|(i, b)| &(b / factorial) * &c[start + i])
+                        .sum()
+                })
+                .collect();
+            for m in 0..k {
+                power.extend(power_derivative(&a, m));
+                power.extend((0..m).map(|_| T::zero()));
+            }
+        }
+        power
+    }
+
+    /// Return the `k - m` power basis coefficients of the `m`'th order derivative on the knot
+    /// span `mu` from the contiguous array returned by [PPSpline::power_basis].
+    #[inline]
+    fn power_coefficients<'a>(&self, power: &'a [T], mu: usize, m: usize) -> &'a [T] {
+        let start = ((mu + 1 - self.k) * self.k + m) * self.k;
+        &power[start..(start + self.k - m)]
     }
 
     pub fn ppdnev_single(&self, x: &f64, m: usize) -> Result<T, PyErr> {
-        let b: Array1<f64> = Array1::from_vec(
-            (0..self.n)
-                .map(|i| bspldnev_single_f64(x, i, &self.k, &self.t, m, None))
-                .collect(),
-        );
         match &self.c {
-            Some(c) => Ok(fdmul11_(&b.view(), &c.view())),
+            Some(c) => {
+                if m >= self.k {
+                    // the spline is piecewise polynomial of degree k - 1, everywhere
+                    return Ok(T::zero());
+                }
+                if let Some(mu) = self.span(x) {
+                    // the power basis is determined on first evaluation after `c` is set
+                    let power = self.power.get_or_init(|| self.power_basis(c));
+                    let (a, u) = (self.power_coefficients(power, mu, m), x - self.t[mu]);
+                    if self.k == 4 && m == 0 {
+                        // most splines are cubic: use the specialised evaluation
+                        return Ok(horner_cubic(a, &u));
+                    }
+                    return Ok(horner(a, &u));
+                }
+                // x is outside the knot domain: use the non-zero b-spline values directly
+                let (start, row) = self.basis_row(x, m);
+                let value: T = row.iter().enumerate().map(|(j, b)| b * &c[start + j]).sum();
+                Ok(value)
+            }
             None => Err(PyValueError::new_err(
                 "Must call `csolve` before evaluating PPSpline.",
             )),
@@ -246,6 +461,7 @@ where
         let ya: Array1<T> = Array1::from_vec(y.to_owned());
         let c: Array1<T> = fdsolve(&b.view(), &ya.view(), allow_lsq);
         self.c = Some(c);
+        self.power = OnceLock::new();
         Ok(())
     }
 
@@ -271,109 +487,228 @@ where
         }
         b
     }
+
+    /// Evaluate the `m`'th derivative at `x` of the spline with coefficients `weights`, i.e.
+    /// the dot product of the b-spline derivative values with `weights`.
+    ///
+    /// Only the non-zero b-splines at `x` are calculated and they are folded directly into the
+    /// sum, so the full row of b-spline values is never constructed.
+    pub fn ppdnev_dot(&self, x: &f64, weights: &[f64], m: usize) -> Result<f64, PyErr> {
+        if weights.len() != self.n {
+            return Err(PyValueError::new_err(
+                "`weights` must have length equal to the number of b-splines, `n`.",
+            ));
+        }
+        let (start, row) = self.basis_row(x, m);
+        Ok(zip(row.iter(), weights[start..].iter())
+            .map(|(b, w)| b * w)
+            .sum())
+    }
+
+    /// Evaluate [PPSpline::ppdnev_dot] at a [Number], applying the chain rule to the
+    /// gradients of `x`.
+    pub fn ppdnev_dot_number(
+        &self,
+        x: &Number,
+        weights: &[f64],
+        m: usize,
+    ) -> Result<Number, PyErr> {
+        match x {
+            Number::F64(f) => Ok(Number::F64(self.ppdnev_dot(f, weights, m)?)),
+            Number::Dual(d) => {
+                let xr = d.real();
+                let v = self.ppdnev_dot(&xr, weights, m)?;
+                let dvdx = self.ppdnev_dot(&xr, weights, m + 1)?;
+                Ok(Number::Dual(Dual::clone_from(d, v, dvdx * d.dual())))
+            }
+            Number::Dual2(d) => {
+                let xr = d.real();
+                let v = self.ppdnev_dot(&xr, weights, m)?;
+                let dvdx = self.ppdnev_dot(&xr, weights, m + 1)?;
+                let d2vdx2 = self.ppdnev_dot(&xr, weights, m + 2)?;
+                let dual2 =
+                    dvdx * d.dual2() + 0.5 * d2vdx2 * fouter11_(&d.dual().view(), &d.dual().view());
+                Ok(Number::Dual2(Dual2::clone_from(
+                    d,
+                    v,
+                    dvdx * d.dual(),
+                    dual2,
+                )))
+            }
+        }
+    }
 }
 
 impl NumberMapping for PPSpline<f64> {
     fn mapped_value(&self, x: &Number) -> Result<Number, PyErr> {
-        match x {
-            Number::F64(f) => Ok(Number::F64(self.ppdnev_single(f, 0_usize)?)),
-            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, 0_usize)?)),
-            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, 0_usize)?)),
-        }
+        self.ppdnev_single_number(x, 0_usize)
     }
 }
 
 impl PPSpline<f64> {
-    pub fn ppdnev_single_dual(&self, x: &Dual, m: usize) -> Result<Dual, PyErr> {
-        let b: Array1<Dual> = Array1::from_vec(
-            (0..self.n)
-                .map(|i| bspldnev_single_dual(x, i, &self.k, &self.t, m, None))
-                .collect(),
-        );
-        match &self.c {
-            Some(c) => Ok(fdmul11_(&c.view(), &b.view())),
-            None => Err(PyValueError::new_err(
-                "Must call `csolve` before evaluating PPSpline.",
-            )),
+    /// Evaluate the `m`-th derivative at a [Number], dispatching on its variant.
+    pub fn ppdnev_single_number(&self, x: &Number, m: usize) -> Result<Number, PyErr> {
+        match x {
+            Number::F64(f) => Ok(Number::F64(self.ppdnev_single(f, m)?)),
+            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, m)?)),
+            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, m)?)),
         }
     }
 
+    /// Evaluate the spline and its derivative with respect to `x` in a single pass over the
+    /// b-splines at `x.real()` and apply the chain rule to the gradient of `x`.
+    pub fn ppdnev_single_dual(&self, x: &Dual, m: usize) -> Result<Dual, PyErr> {
+        let xr = x.real();
+        let b = self.ppdnev_single(&xr, m)?;
+        let dbdx = self.ppdnev_single(&xr, m + 1)?;
+        Ok(Dual::clone_from(x, b, dbdx * x.dual()))
+    }
+
+    /// Evaluate the spline and its first two derivatives with respect to `x` at `x.real()`
+    /// and apply the chain rule to the first and second order gradients of `x`.
     pub fn ppdnev_single_dual2(&self, x: &Dual2, m: usize) -> Result<Dual2, PyErr> {
-        let b: Array1<Dual2> = Array1::from_vec(
-            (0..self.n)
-                .map(|i| bspldnev_single_dual2(x, i, &self.k, &self.t, m, None))
-                .collect(),
-        );
-        match &self.c {
-            Some(c) => Ok(fdmul11_(&c.view(), &b.view())),
-            None => Err(PyValueError::new_err(
-                "Must call `csolve` before evaluating PPSpline.",
-            )),
+        let xr = x.real();
+        let b = self.ppdnev_single(&xr, m)?;
+        let dbdx = self.ppdnev_single(&xr, m + 1)?;
+        let d2bdx2 = self.ppdnev_single(&xr, m + 2)?;
+        let dual2 = dbdx * x.dual2() + 0.5 * d2bdx2 * fouter11_(&x.dual().view(), &x.dual().view());
+        Ok(Dual2::clone_from(x, b, dbdx * x.dual(), dual2))
+    }
+
+    /// Evaluate the `m`'th derivative at each `x` in single precision.
+    ///
+    /// The offset of `x` from the start of its knot span is calculated in double precision,
+    /// since knots are often large, e.g. posix timestamps, and the polynomial is then evaluated
+    /// with the power basis coefficients rounded to single precision. Values outside of the
+    /// spline domain are evaluated in double precision and rounded.
+    pub fn ppdnev_many_f32(&self, x: ArrayView1<f32>, m: usize) -> Result<Vec<f32>, PyErr> {
+        let c = match &self.c {
+            Some(c) => c,
+            None => {
+                return Err(PyValueError::new_err(
+                    "Must call `csolve` before evaluating PPSpline.",
+                ))
+            }
+        };
+        if m >= self.k {
+            return Ok(vec![0.0_f32; x.len()]);
         }
+        let power = self.power.get_or_init(|| self.power_basis(c));
+        let a: Vec<Vec<f32>> = ((self.k - 1)..self.n)
+            .map(|mu| {
+                self.power_coefficients(power, mu, m)
+                    .iter()
+                    .map(|v| *v as f32)
+                    .collect()
+            })
+            .collect();
+        x.iter()
+            .map(|xi| {
+                let xi = *xi as f64;
+                match self.span(&xi) {
+                    Some(mu) => {
+                        let u = (xi - self.t[mu]) as f32;
+                        Ok(a[mu + 1 - self.k]
+                            .iter()
+                            .rev()
+                            .fold(0.0_f32, |acc, v| acc * u + v))
+                    }
+                    None => Ok(self.ppdnev_single(&xi, m)? as f32),
+                }
+            })
+            .collect()
+    }
+
+    /// Evaluate the spline at each `x[i]`, with gradient given by the row `tangents[i, :]`,
+    /// writing values into `out` and gradients into the rows of `out_grad`.
+    ///
+    /// This is equivalent to [PPSpline::ppdnev_single_dual] for each element but does not
+    /// allocate a [Dual] per point.
+    pub fn ppdnev_many_dual_into(
+        &self,
+        x: ArrayView1<f64>,
+        tangents: ArrayView2<f64>,
+        mut out: ArrayViewMut1<f64>,
+        mut out_grad: ArrayViewMut2<f64>,
+        m: usize,
+    ) -> Result<(), PyErr> {
+        if x.len() != out.len() || tangents.dim() != out_grad.dim() || tangents.nrows() != x.len() {
+            return Err(PyValueError::new_err(
+                "Shapes of `x`, `tangents`, `out` and `out_grad` are not aligned.",
+            ));
+        }
+        for (i, xi) in x.iter().enumerate() {
+            out[i] = self.ppdnev_single(xi, m)?;
+            let dbdx = self.ppdnev_single(xi, m + 1)?;
+            Zip::from(out_grad.row_mut(i))
+                .and(tangents.row(i))
+                .for_each(|o, t| *o = dbdx * t);
+        }
+        Ok(())
     }
 }
 
 impl NumberMapping for PPSpline<Dual> {
     fn mapped_value(&self, x: &Number) -> Result<Number, PyErr> {
-        match x {
-            Number::F64(f) => Ok(Number::Dual(self.ppdnev_single(f, 0_usize)?)),
-            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, 0_usize)?)),
-            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, 0_usize)?)),
-        }
+        self.ppdnev_single_number(x, 0_usize)
     }
 }
 
 impl PPSpline<Dual> {
+    /// Evaluate the `m`-th derivative at a [Number], dispatching on its variant.
+    pub fn ppdnev_single_number(&self, x: &Number, m: usize) -> Result<Number, PyErr> {
+        match x {
+            Number::F64(f) => Ok(Number::Dual(self.ppdnev_single(f, m)?)),
+            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, m)?)),
+            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, m)?)),
+        }
+    }
+
     pub fn ppdnev_single_dual2(&self, _x: &Dual2, _m: usize) -> Result<Dual2, PyErr> {
         Err(PyTypeError::new_err(
             "Cannot index with type `Dual2` on PPSpline<Dual>`.",
         ))
     }
 
+    /// Evaluate by first order expansion about `x.real()`, which combines the gradients of
+    /// the spline coefficients with the gradient of `x`.
     pub fn ppdnev_single_dual(&self, x: &Dual, m: usize) -> Result<Dual, PyErr> {
-        let b: Array1<Dual> = Array1::from_vec(
-            (0..self.n)
-                .map(|i| bspldnev_single_dual(x, i, &self.k, &self.t, m, None))
-                .collect(),
-        );
-        match &self.c {
-            Some(c) => Ok(dmul11_(&c.view(), &b.view())),
-            None => Err(PyValueError::new_err(
-                "Must call `csolve` before evaluating PPSpline.",
-            )),
-        }
+        let xr = x.real();
+        let delta = x - xr;
+        Ok(self.ppdnev_single(&xr, m)? + self.ppdnev_single(&xr, m + 1)? * delta)
     }
 }
 
 impl NumberMapping for PPSpline<Dual2> {
     fn mapped_value(&self, x: &Number) -> Result<Number, PyErr> {
-        match x {
-            Number::F64(f) => Ok(Number::Dual2(self.ppdnev_single(f, 0_usize)?)),
-            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, 0_usize)?)),
-            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, 0_usize)?)),
-        }
+        self.ppdnev_single_number(x, 0_usize)
     }
 }
 
 impl PPSpline<Dual2> {
+    /// Evaluate the `m`-th derivative at a [Number], dispatching on its variant.
+    pub fn ppdnev_single_number(&self, x: &Number, m: usize) -> Result<Number, PyErr> {
+        match x {
+            Number::F64(f) => Ok(Number::Dual2(self.ppdnev_single(f, m)?)),
+            Number::Dual(d) => Ok(Number::Dual(self.ppdnev_single_dual(d, m)?)),
+            Number::Dual2(d) => Ok(Number::Dual2(self.ppdnev_single_dual2(d, m)?)),
+        }
+    }
+
     pub fn ppdnev_single_dual(&self, _x: &Dual, _m: usize) -> Result<Dual, PyErr> {
         Err(PyTypeError::new_err(
             "Cannot index with type `Dual` on PPSpline<Dual2>.",
         ))
     }
 
+    /// Evaluate by second order expansion about `x.real()`, which combines the gradients of
+    /// the spline coefficients with the gradients of `x`.
     pub fn ppdnev_single_dual2(&self, x: &Dual2, m: usize) -> Result<Dual2, PyErr> {
-        let b: Array1<Dual2> = Array1::from_vec(
-            (0..self.n)
-                .map(|i| bspldnev_single_dual2(x, i, &self.k, &self.t, m, None))
-                .collect(),
-        );
-        match &self.c {
-            Some(c) => Ok(dmul11_(&c.view(), &b.view())),
-            None => Err(PyValueError::new_err(
-                "Must call `csolve` before evaluating PPSpline.",
-            )),
-        }
+        let xr = x.real();
+        let delta = x - xr;
+        Ok(self.ppdnev_single(&xr, m)?
+            + self.ppdnev_single(&xr, m + 1)? * &delta
+            + 0.5 * self.ppdnev_single(&xr, m + 2)? * &delta * &delta)
     }
 }
 
@@ -520,6 +855,22 @@ mod tests {
         assert_eq!(result, expected)
     }
 
+    #[test]
+    fn partition_point_branchless_() {
+        let t: Vec<f64> = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        for x in [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 4.5] {
+            assert_eq!(
+                partition_point_branchless(&t, |v| *v < x),
+                t.partition_point(|v| *v < x)
+            );
+            assert_eq!(
+                partition_point_branchless(&t, |v| *v <= x),
+                t.partition_point(|v| *v <= x)
+            );
+        }
+        assert_eq!(partition_point_branchless(&[], |v| *v < 1.0), 0);
+    }
+
     #[test]
     fn ppspline_new() {
         let _pps: PPSpline<f64> = PPSpline::new(
@@ -597,6 +948,204 @@ mod tests {
         assert!(is_close(&r3, &1.136, None));
     }
 
+    #[test]
+    fn ppdnev_single_support() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t.clone(), None);
+        let c = vec![1., 2., -1., 2., 1., 1., 2., 2.];
+        pps.c = Some(Array1::from_vec(c.clone()));
+        for x in [1.0, 1.1, 1.8, 2.0, 2.5, 3.0, 3.7, 4.0] {
+            for m in 0..5_usize {
+                let expected: f64 = (0..8)
+                    .map(|i| bspldnev_single_f64(&x, i, &4_usize, &t, m, None) * c[i])
+                    .sum();
+                let result = pps.ppdnev_single(&x, m).unwrap();
+                assert!(is_close(&result, &expected, None));
+            }
+        }
+    }
+
+    #[test]
+    fn basis_row_() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let pps: PPSpline<f64> = PPSpline::new(4, t, None);
+        let (start, row) = pps.basis_row(&1.5, 0);
+        assert_eq!(start, 0);
+        assert_eq!(row, vec![0.125, 0.375, 0.375, 0.125]);
+        let (start, row) = pps.basis_row(&4.0, 1);
+        assert_eq!(start, 4);
+        assert_eq!(row, vec![0., 0., -3., 3.]);
+        let (start, row) = pps.basis_row(&4.0, 2);
+        assert_eq!(start, 4);
+        assert_eq!(row, vec![0., 3., -9., 6.]);
+    }
+
+    #[test]
+    fn ppdnev_single_after_repeated_csolve() {
+        let t = vec![0., 0., 0., 0., 4., 4., 4., 4.];
+        let tau = vec![0., 1., 3., 4.];
+        let mut pps: PPSpline<f64> = PPSpline::new(4, t, None);
+        let _ = pps.csolve(&tau, &vec![0., 0., 2., 2.], 0, 0, false);
+        let r1 = pps.ppdnev_single(&3.0, 0).unwrap();
+        assert!(is_close(&r1, &2.0, None));
+        let _ = pps.csolve(&tau, &vec![0., 0., 4., 4.], 0, 0, false);
+        let r2 = pps.ppdnev_single(&3.0, 0).unwrap();
+        assert!(is_close(&r2, &4.0, None));
+    }
+
+    #[test]
+    fn ppdnev_single_dual_fused() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let c = vec![1., 2., -1., 2., 1., 1., 2., 2.];
+        let mut pps = PPSpline::new(4, t.clone(), None);
+        pps.c = Some(Array1::from_vec(c.clone()));
+        let x = Dual::try_new(2.5, vec!["x".to_string()], vec![2.0]).unwrap();
+        for m in 0..3_usize {
+            let result = pps.ppdnev_single_dual(&x, m).unwrap();
+            let expected: Dual = (0..8)
+                .map(|i| c[i] * bspldnev_single_dual(&x, i, &4_usize, &t, m, None))
+                .sum();
+            assert!(is_close(&result.real(), &expected.real(), None));
+            assert!(is_close(&result.dual()[0], &expected.dual()[0], None));
+        }
+    }
+
+    #[test]
+    fn ppdnev_single_number_() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]));
+        for m in 0..3_usize {
+            let expected = pps.ppdnev_single(&2.5, m).unwrap();
+            match pps.ppdnev_single_number(&Number::F64(2.5), m).unwrap() {
+                Number::F64(f) => assert_eq!(f, expected),
+                _ => panic!("expected Number::F64"),
+            }
+        }
+    }
+
+    #[test]
+    fn ppdnev_many_dual_into_() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]));
+        let x = arr1(&[1.5, 2.5, 3.5]);
+        let tangents = arr2(&[[1.0, 0.0], [0.0, 2.0], [3.0, 1.0]]);
+        let mut out = Array1::<f64>::zeros(3);
+        let mut out_grad = Array2::<f64>::zeros((3, 2));
+        pps.ppdnev_many_dual_into(
+            x.view(),
+            tangents.view(),
+            out.view_mut(),
+            out_grad.view_mut(),
+            0,
+        )
+        .unwrap();
+        for i in 0..3 {
+            let vars = vec!["a".to_string(), "b".to_string()];
+            let xd = Dual::try_new(x[i], vars, tangents.row(i).to_vec()).unwrap();
+            let expected = pps.ppdnev_single_dual(&xd, 0).unwrap();
+            assert_eq!(out[i], expected.real());
+            assert_eq!(out_grad.row(i).to_vec(), expected.dual().to_vec());
+        }
+    }
+
+    #[test]
+    fn ppdnev_many_dual_into_shape_err() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]));
+        let x = arr1(&[1.5, 2.5]);
+        let tangents = Array2::<f64>::zeros((2, 2));
+        let mut out = Array1::<f64>::zeros(3);
+        let mut out_grad = Array2::<f64>::zeros((2, 2));
+        assert!(pps
+            .ppdnev_many_dual_into(
+                x.view(),
+                tangents.view(),
+                out.view_mut(),
+                out_grad.view_mut(),
+                0
+            )
+            .is_err());
+    }
+
+    #[test]
+    fn ppdnev_many_f32_() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]));
+        let x = arr1(&[0.5_f32, 1.0, 1.5, 2.0, 2.5, 3.75, 4.0]);
+        for m in 0..5_usize {
+            let result = pps.ppdnev_many_f32(x.view(), m).unwrap();
+            for (xi, r) in zip(x.iter(), result.iter()) {
+                let expected = pps.ppdnev_single(&(*xi as f64), m).unwrap();
+                assert!((*r as f64 - expected).abs() < 1e-5 * expected.abs().max(1.0));
+            }
+        }
+    }
+
+    #[test]
+    fn ppdnev_dot_() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let c = vec![1., 2., -1., 2., 1., 1., 2., 2.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(c.clone()));
+        for x in [0.5, 1.0, 1.5, 2.0, 2.5, 3.75, 4.0] {
+            for m in 0..5_usize {
+                let result = pps.ppdnev_dot(&x, &c, m).unwrap();
+                let expected = pps.ppdnev_single(&x, m).unwrap();
+                assert!(is_close(&result, &expected, None));
+            }
+        }
+        assert!(pps.ppdnev_dot(&1.5, &c[..7], 0).is_err());
+    }
+
+    #[test]
+    fn ppdnev_single_high_order_is_zero() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let mut pps = PPSpline::new(4, t, None);
+        pps.c = Some(Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]));
+        for x in [0.5, 1.5, 4.0, 4.5] {
+            assert_eq!(pps.ppdnev_single(&x, 4).unwrap(), 0.0);
+            assert_eq!(pps.ppdnev_single(&x, 7).unwrap(), 0.0);
+        }
+    }
+
+    #[test]
+    fn power_basis_contiguous_layout() {
+        let t = vec![1., 1., 1., 1., 2., 2., 2., 3., 4., 4., 4., 4.];
+        let c = Array1::from_vec(vec![1., 2., -1., 2., 1., 1., 2., 2.]);
+        let pps = PPSpline::new(4, t, Some(c.to_vec()));
+        let power = pps.power_basis(&c);
+        assert_eq!(power.len(), 5 * 16);
+        for (mu, x) in [(3_usize, 1.5), (6, 2.5), (7, 3.75)] {
+            for m in 0..4_usize {
+                let a = pps.power_coefficients(&power, mu, m);
+                assert_eq!(a.len(), 4 - m);
+                let (start, row) = pps.basis_row(&x, m);
+                let expected: f64 = row.iter().enumerate().map(|(i, b)| b * c[start + i]).sum();
+                assert!(is_close(&horner(a, &(x - pps.t[mu])), &expected, None));
+            }
+        }
+    }
+
+    #[test]
+    fn horner_() {
+        // 1 + 2u + 3u^2
+        let a = vec![1.0, 2.0, 3.0];
+        assert_eq!(horner(&a, &2.0), 17.0);
+        assert_eq!(horner(&power_derivative(&a, 1), &2.0), 14.0);
+        assert_eq!(horner(&power_derivative(&a, 2), &2.0), 6.0);
+        assert_eq!(horner(&power_derivative(&a, 3), &2.0), 0.0);
+    }
+
+    #[test]
+    fn horner_cubic_() {
+        let a = vec![1.0, 2.0, 3.0, -1.0];
+        assert_eq!(horner_cubic(&a, &2.0), horner(&a, &2.0));
+    }
+
     #[test]
     fn partialeq_() {
         let pp1 = PPSpline::<f64>::new(2, vec![1., 1., 2., 2.], None);
@@ -6,7 +6,10 @@ use crate::json::JSON;
 use crate::splines::spline::{bspldnev_single_f64, bsplev_single_f64, PPSpline};
 use std::cmp::PartialEq;
 
-use numpy::{PyArray2, ToPyArray};
+use numpy::{
+    PyArray1, PyArray2, PyReadonlyArray1, PyReadonlyArray2, PyReadwriteArray1, PyReadwriteArray2,
+    ToPyArray,
+};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use serde::{Deserialize, Serialize};
@@ -19,8 +22,35 @@ pub enum PyNumberPPSpline {
     Dual2(PPSplineDual2),
 }
 
+/// Evaluate an array of float *x* coordinates on a [PPSpline] for the Python interface.
+///
+/// Only the f64 spline releases the GIL. Dual and Dual2 evaluation allocates AD vectors per
+/// value and keeps the GIL, as it did originally.
+trait PPEvalVec<T> {
+    fn ppdnev_vec(&self, py: Python<'_>, x: &[f64], m: usize) -> PyResult<Vec<T>>;
+}
+
+impl PPEvalVec<f64> for PPSpline<f64> {
+    fn ppdnev_vec(&self, py: Python<'_>, x: &[f64], m: usize) -> PyResult<Vec<f64>> {
+        py.allow_threads(|| x.iter().map(|v| self.ppdnev_single(v, m)).collect())
+    }
+}
+
+impl PPEvalVec<Dual> for PPSpline<Dual> {
+    fn ppdnev_vec(&self, _py: Python<'_>, x: &[f64], m: usize) -> PyResult<Vec<Dual>> {
+        x.iter().map(|v| self.ppdnev_single(v, m)).collect()
+    }
+}
+
+impl PPEvalVec<Dual2> for PPSpline<Dual2> {
+    fn ppdnev_vec(&self, _py: Python<'_>, x: &[f64], m: usize) -> PyResult<Vec<Dual2>> {
+        x.iter().map(|v| self.ppdnev_single(v, m)).collect()
+    }
+}
+
 macro_rules! create_interface {
-    ($name: ident, $type: ident) => {
+    ($name: ident, $type: ident, $doc: literal) => {
+        #[doc = $doc]
         #[pyclass(module = "rateslib.rs")]
         #[derive(Clone, Deserialize, Serialize)]
         pub(crate) struct $name {
@@ -187,12 +217,14 @@ macro_rules! create_interface {
             ///    provided methods :meth:`~rateslib.splines.PPSplineF64.ppev_single_dual` or
             ///    :meth:`~rateslib.splines.PPSplineF64.ppev_single_dual2` respectively.
             ///
+            /// For :class:`~rateslib.splines.PPSplineF64` the GIL is released during evaluation
+            /// so that separate threads may evaluate splines concurrently.
+            ///
             /// Returns
             /// -------
             /// 1-d array of float
-            fn ppev(&self, x: Vec<f64>) -> PyResult<Vec<$type>> {
-                let out: Vec<$type> = x.iter().map(|v| self.inner.ppdnev_single(&v, 0)).collect::<Result<Vec<$type>, _>>()?;
-                Ok(out)
+            fn ppev(&self, py: Python<'_>, x: Vec<f64>) -> PyResult<Vec<$type>> {
+                self.inner.ppdnev_vec(py, &x, 0)
             }
 
             /// Evaluate a single *x* coordinate derivative from the right on the pp spline.
@@ -290,6 +322,9 @@ macro_rules! create_interface {
             ///    **converted** to *float*. Therefore it does not guarantee the preservation of AD
             ///    sensitivities.
             ///
+            /// For :class:`~rateslib.splines.PPSplineF64` the GIL is released during evaluation
+            /// so that separate threads may evaluate splines concurrently.
+            ///
             /// Parameters
             /// ----------
             /// x: 1-d array of float
@@ -300,9 +335,34 @@ macro_rules! create_interface {
             /// Returns
             /// -------
             /// 1-d array of float
-            fn ppdnev(&self, x: Vec<f64>, m: usize) -> PyResult<Vec<$type>> {
-                let out: Vec<$type> = x.iter().map(|v| self.inner.ppdnev_single(&v, m)).collect::<Result<Vec<$type>, _>>()?;
-                Ok(out)
+            fn ppdnev(&self, py: Python<'_>, x: Vec<f64>, m: usize) -> PyResult<Vec<$type>> {
+                self.inner.ppdnev_vec(py, &x, m)
+            }
+
+            /// Evaluate a single *x* coordinate derivative of the spline with the given
+            /// coefficients.
+            ///
+            /// Parameters
+            /// ----------
+            /// x: float, Dual, Dual2
+            ///     The x-axis value at which to evaluate value.
+            /// weights: 1-d array of float
+            ///     The spline coefficients, of length *n*, used in place of *c*.
+            /// m: int
+            ///     The order of derivative to calculate value for (0 is function value).
+            ///
+            /// Returns
+            /// -------
+            /// float, Dual, or Dual2, based on *x*
+            ///
+            /// Notes
+            /// -----
+            /// This is the dot product of the b-spline derivative values at *x* with
+            /// *weights*, but only the non-zero b-splines are calculated and the b-spline
+            /// values are not returned. *weights* are not AD sensitive. It does not require
+            /// ``csolve`` to have been called.
+            fn ppdnev_dot(&self, x: Number, weights: Vec<f64>, m: usize) -> PyResult<Number> {
+                self.inner.ppdnev_dot_number(&x, &weights, m)
             }
 
             /// Evaluate value of the *i* th b-spline at x coordinates.
@@ -417,9 +477,21 @@ macro_rules! create_interface {
     };
 }
 
-create_interface!(PPSplineF64, f64);
-create_interface!(PPSplineDual, Dual);
-create_interface!(PPSplineDual2, Dual2);
+create_interface!(
+    PPSplineF64,
+    f64,
+    "Piecewise polynomial spline composed of float values on the x and y axes."
+);
+create_interface!(
+    PPSplineDual,
+    Dual,
+    "Piecewise polynomial spline composed of float values on the x-axis and Dual values on the y-axis."
+);
+create_interface!(
+    PPSplineDual2,
+    Dual2,
+    "Piecewise polynomial spline composed of float values on the x-axis and Dual2 values on the y-axis."
+);
 
 impl IntoPy<PyObject> for PyNumberPPSpline {
     fn into_py(self, py: Python<'_>) -> PyObject {
@@ -551,3 +623,113 @@ pub(crate) fn bspldnev_single(
 ) -> PyResult<f64> {
     Ok(bspldnev_single_f64(&x, i, &k, &t, m, org_k))
 }
+
+/// Evaluate a single x-axis data point, or a derivative value, on a *PPSpline*.
+///
+/// Parameters
+/// ----------
+/// spline: PPSplineF64, PPSplineDual or PPSplineDual2
+///     The *PPSpline* to evaluate.
+/// x: float, Dual, Dual2
+///     The x-axis value at which to evaluate.
+/// m: int, optional
+///     The order of derivative to calculate value for.
+///
+/// Returns
+/// -------
+/// float, Dual, Dual2
+///
+/// Notes
+/// -----
+/// The spline is borrowed rather than extracted so that no copy of its coefficients is made
+/// and dispatch on the type of ``x`` is performed without returning to Python.
+#[pyfunction]
+#[pyo3(signature = (spline, x, m=0))]
+pub(crate) fn evaluate(spline: &Bound<'_, PyAny>, x: Number, m: usize) -> PyResult<Number> {
+    if let Ok(s) = spline.downcast::<PPSplineF64>() {
+        s.borrow().inner.ppdnev_single_number(&x, m)
+    } else if let Ok(s) = spline.downcast::<PPSplineDual>() {
+        s.borrow().inner.ppdnev_single_number(&x, m)
+    } else if let Ok(s) = spline.downcast::<PPSplineDual2>() {
+        s.borrow().inner.ppdnev_single_number(&x, m)
+    } else {
+        Err(PyTypeError::new_err(
+            "`spline` must be of type PPSplineF64, PPSplineDual or PPSplineDual2.",
+        ))
+    }
+}
+
+/// Evaluate a *PPSplineF64* at many *Dual* x-axis values, writing into pre-allocated arrays.
+///
+/// Parameters
+/// ----------
+/// spline: PPSplineF64
+///     The *PPSpline* to evaluate.
+/// x: 1-d array of float
+///     The real components of the x-axis values.
+/// x_grad: 2-d array of float
+///     The gradients of each x-axis value, stored by row.
+/// out: 1-d array of float
+///     The array into which the real components of the spline values are written.
+/// out_grad: 2-d array of float
+///     The array into which the gradients of the spline values are written, by row.
+/// m: int, optional
+///     The order of derivative to calculate value for.
+///
+/// Returns
+/// -------
+/// None
+///
+/// Notes
+/// -----
+/// The GIL is released during evaluation.
+#[pyfunction]
+#[pyo3(signature = (spline, x, x_grad, out, out_grad, m=0))]
+pub(crate) fn ppdnev_dual_into(
+    py: Python<'_>,
+    spline: PyRef<'_, PPSplineF64>,
+    x: PyReadonlyArray1<'_, f64>,
+    x_grad: PyReadonlyArray2<'_, f64>,
+    mut out: PyReadwriteArray1<'_, f64>,
+    mut out_grad: PyReadwriteArray2<'_, f64>,
+    m: usize,
+) -> PyResult<()> {
+    let inner = &spline.inner;
+    let (x, x_grad) = (x.as_array(), x_grad.as_array());
+    let (out, out_grad) = (out.as_array_mut(), out_grad.as_array_mut());
+    py.allow_threads(|| inner.ppdnev_many_dual_into(x, x_grad, out, out_grad, m))
+}
+
+/// Evaluate a *PPSplineF64* at many single precision x-axis values, in single precision.
+///
+/// Parameters
+/// ----------
+/// spline: PPSplineF64
+///     The *PPSpline* to evaluate.
+/// x: 1-d array of float32
+///     The x-axis values at which to evaluate.
+/// m: int, optional
+///     The order of derivative to calculate value for.
+///
+/// Returns
+/// -------
+/// 1-d array of float32
+///
+/// Notes
+/// -----
+/// The spline coefficients are rounded to single precision, so results agree with
+/// :meth:`~rateslib.splines.PPSplineF64.ppdnev` only to around 7 significant figures. Knots are
+/// retained in double precision. The GIL is released during evaluation.
+#[pyfunction]
+#[pyo3(signature = (spline, x, m=0))]
+pub(crate) fn ppdnev_f32<'py>(
+    py: Python<'py>,
+    spline: PyRef<'py, PPSplineF64>,
+    x: PyReadonlyArray1<'py, f32>,
+    m: usize,
+) -> PyResult<Bound<'py, PyArray1<f32>>> {
+    let inner = &spline.inner;
+    let x = x.as_array();
+    let v = py.allow_threads(|| inner.ppdnev_many_f32(x, m))?;
+    Ok(PyArray1::from_vec_bound(py, v))
+}